@@ -56,7 +56,7 @@ from money_warp.tax import (
 )
 from money_warp.time_context import TimeContext
 from money_warp.tz import ensure_aware, get_tz, now, set_tz, tz_aware
-from money_warp.warp import InvalidDateError, NestedWarpError, Warp, WarpError
+from money_warp.warp import BackwardWarpError, InactiveWarpError, InvalidDateError, NestedWarpError, Warp, WarpError
 from money_warp.working_day import (
     BrazilianWorkingDayCalendar,
     EveryDayCalendar,
@@ -68,6 +68,7 @@ __all__ = [
     "IOF",
     "Allocation",
     "AnticipationResult",
+    "BackwardWarpError",
     "BaseBillingCycle",
     "BaseScheduler",
     "BaseTax",
@@ -87,6 +88,7 @@ __all__ = [
     "GrossupResult",
     "HappenedCashFlowEntry",
     "IOFRounding",
+    "InactiveWarpError",
     "IndividualIOF",
     "Installment",
     "InterestRate",
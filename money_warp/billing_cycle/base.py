@@ -5,7 +5,7 @@ from datetime import date, datetime, tzinfo
 from decimal import Decimal
 from typing import List, Optional
 
-from ..cash_flow import CashFlow
+from ..cash_flow import CashFlow, CashFlowQuery
 from ..money import Money
 from ..tz import to_date
 from .statement import Statement
@@ -151,7 +151,7 @@ class BaseBillingCycle(ABC):
     ) -> Money:
         """Sum item amounts for *category* in the half-open interval (after, up_to]."""
         return (
-            cash_flow.query.filter_by(category=category)
+            CashFlowQuery(cash_flow.entries_by_category(category))
             .filter_by(datetime__gt=after, datetime__lte=up_to)
             .sum_amounts()
         )
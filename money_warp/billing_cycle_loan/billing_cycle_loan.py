@@ -340,8 +340,12 @@ class BillingCycleLoan:
     # Derived state
     # ------------------------------------------------------------------
 
-    def _compute_state(self) -> LoanState:
-        """Run the forward pass with per-cycle mora rate resolution."""
+    def _compute_state(self, now: Optional[datetime] = None) -> LoanState:
+        """Run the forward pass with per-cycle mora rate resolution.
+
+        Callers that also need the current time pass it as *now* so a
+        single clock read serves the whole computation.
+        """
         return compute_state(
             self.principal,
             self._interest,
@@ -352,7 +356,7 @@ class BillingCycleLoan:
             self.grace_period_days,
             self.disbursement_date,
             self._payment_entries(),
-            self.now(),
+            now if now is not None else self.now(),
             tz=self._time_ctx.tz,
             base_mora_rate=self.mora_interest_rate,
             mora_rate_resolver=self.mora_rate_resolver,
@@ -362,7 +366,7 @@ class BillingCycleLoan:
 
     def _payment_entries(self) -> list:
         """Payment CashFlowEntry objects, sorted by datetime."""
-        entries = [e for e in self.cashflow.items() if "payment" in e.category]
+        entries = self.cashflow.entries_by_category("payment")
         return sorted(entries, key=lambda e: e.datetime)
 
     # ------------------------------------------------------------------
@@ -377,13 +381,14 @@ class BillingCycleLoan:
     @property
     def installments(self) -> List[Installment]:
         """Installment view (derived from CashFlow)."""
-        state = self._compute_state()
+        now = self.now()
+        state = self._compute_state(now)
         return build_installments(
             self.get_original_schedule(),
             state.settlements,
             state.fines_applied,
             state.principal_balance,
-            self.now(),
+            now,
             self._interest,
             state.last_accrual_end,
             tz=self._time_ctx.tz,
@@ -418,8 +423,9 @@ class BillingCycleLoan:
 
     def _accrued_interest_components(self) -> tuple:
         """Return (regular, mora) accrued since last payment."""
-        state = self._compute_state()
-        days = (self._time_ctx.to_date(self.now()) - self._time_ctx.to_date(state.last_accrual_end)).days
+        now = self.now()
+        state = self._compute_state(now)
+        days = (self._time_ctx.to_date(now) - self._time_ctx.to_date(state.last_accrual_end)).days
 
         if state.principal_balance.is_positive() and days > 0:
             covered = covered_due_date_count(
@@ -536,7 +542,9 @@ class BillingCycleLoan:
 
     def days_since_last_payment(self) -> int:
         """Days since the last payment."""
-        return (self._time_ctx.to_date(self.now()) - self._time_ctx.to_date(self.last_payment_date)).days
+        now = self.now()
+        last_payment_date = self._compute_state(now).last_payment_date
+        return (self._time_ctx.to_date(now) - self._time_ctx.to_date(last_payment_date)).days
 
     def _covered_due_date_count(self) -> int:
         return covered_due_date_count(self.principal_balance, self.get_original_schedule())
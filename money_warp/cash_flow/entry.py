@@ -68,6 +68,14 @@ class CashFlowEntry(ABC):
     def is_zero(self) -> bool:
         return self.amount.is_zero()
 
+    def __deepcopy__(self, memo: dict) -> "CashFlowEntry":
+        """Return ``self``: entries are frozen and hold only immutable values.
+
+        Warp deep-copies whole loans and cash flows; sharing the entries
+        leaves only the item timelines and time contexts to copy.
+        """
+        return self
+
     def __str__(self) -> str:
         desc = f" - {self.description}" if self.description else ""
         return f"{self.amount} on {self.datetime}{desc}"
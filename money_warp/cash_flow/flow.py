@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterator, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from ..money import Money
 from .entry import CashFlowEntry, CashFlowType, CategoryInput
@@ -21,6 +21,8 @@ class CashFlow:
 
     def __init__(self, items: Optional[List[CashFlowItem]] = None) -> None:
         self._items: List[CashFlowItem] = list(items) if items else []
+        self._category_index: Optional[Dict[str, List[CashFlowItem]]] = None
+        self._category_index_revision = -1
 
     @classmethod
     def empty(cls) -> "CashFlow":
@@ -34,6 +36,7 @@ class CashFlow:
     def add_item(self, item: CashFlowItem) -> None:
         """Add a cash flow item to this stream."""
         self._items.append(item)
+        self._category_index = None
 
     def add(
         self,
@@ -60,6 +63,19 @@ class CashFlow:
         """Active entries sorted by datetime."""
         return sorted(self.items(), key=lambda e: e.datetime)
 
+    def entries_by_category(self, category: str) -> List[CashFlowEntry]:
+        """Active entries whose category contains *category*.
+
+        Only items that carry the tag somewhere in their timeline are
+        resolved, using an index built lazily on first use.
+        """
+        entries = []
+        for item in self._category_index_for(category):
+            entry = item.resolve()
+            if entry is not None and category in entry.category:
+                entries.append(entry)
+        return entries
+
     # ------------------------------------------------------------------
     # Raw access (for internal temporal operations)
     # ------------------------------------------------------------------
@@ -68,6 +84,19 @@ class CashFlow:
         """Underlying temporal containers (use for update/delete)."""
         return list(self._items)
 
+    def _category_index_for(self, category: str) -> List[CashFlowItem]:
+        # Per-item revisions only grow, so their sum changes exactly when an
+        # item of this flow gained a tag since the index was built.
+        revision = sum(item._tag_revision for item in self._items)
+        if self._category_index is None or self._category_index_revision != revision:
+            index: Dict[str, List[CashFlowItem]] = {}
+            for item in self._items:
+                for tag in item.tags:
+                    index.setdefault(tag, []).append(item)
+            self._category_index = index
+            self._category_index_revision = revision
+        return self._category_index.get(category, [])
+
     # ------------------------------------------------------------------
     # Query
     # ------------------------------------------------------------------
@@ -118,33 +147,19 @@ class CashFlow:
 
     def net_present_value(self) -> Money:
         """Simple sum of all active cash flows (no discounting)."""
-        entries = self.items()
-        if not entries:
-            return Money.zero()
-        total = Money.zero()
-        for entry in entries:
-            total = total + entry.amount
-        return total
+        return Money(sum((entry.amount.raw_amount for entry in self.items()), Decimal("0")))
 
     def total_inflows(self) -> Money:
         """Sum of all positive cash flows."""
-        total = Money.zero()
-        for entry in self.items():
-            if entry.is_inflow():
-                total = total + entry.amount
-        return total
+        return Money(sum((entry.amount.raw_amount for entry in self.items() if entry.is_inflow()), Decimal("0")))
 
     def total_outflows(self) -> Money:
         """Sum of all negative cash flows (returned as positive amount)."""
-        total = Money.zero()
-        for entry in self.items():
-            if entry.is_outflow():
-                total = total + abs(entry.amount)
-        return total
+        return Money(sum((-entry.amount.raw_amount for entry in self.items() if entry.is_outflow()), Decimal("0")))
 
     def filter_by_category(self, category: str) -> "CashFlow":
         """New CashFlow containing only items with the specified category."""
-        return self.query.filter_by(category=category).to_cash_flow()
+        return CashFlowQuery(self.entries_by_category(category)).to_cash_flow()
 
     def filter_by_kind(self, kind: CashFlowType) -> "CashFlow":
         """New CashFlow containing only items with the specified kind."""
@@ -1,8 +1,9 @@
 """CashFlowItem — time-aware container for CashFlowEntry versions."""
 
+import copy
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from typing import FrozenSet, List, Optional, Tuple, Union
 
 from ..money import Money
 from ..time_context import TimeContext
@@ -68,6 +69,10 @@ class CashFlowItem:
 
         start = effective_date if effective_date is not None else EPOCH
         self._timeline: List[Tuple["datetime", Optional[CashFlowEntry]]] = [(start, initial)]
+        self._tags: FrozenSet[str] = initial.category
+        # Bumped whenever this item gains a category tag it never had before,
+        # so that a ``CashFlow`` holding it knows to rebuild its category index.
+        self._tag_revision = 0
         self._time_ctx = time_context
 
     # ------------------------------------------------------------------
@@ -89,12 +94,20 @@ class CashFlowItem:
         """From *effective_date* onward this item resolves to *new_entry*."""
         self._timeline.append((effective_date, new_entry))
         self._timeline.sort(key=lambda t: t[0])
+        if not new_entry.category <= self._tags:
+            self._tags = self._tags | new_entry.category
+            self._tag_revision += 1
 
     def delete(self, effective_date: "datetime") -> None:
         """From *effective_date* onward this item resolves to ``None``."""
         self._timeline.append((effective_date, None))
         self._timeline.sort(key=lambda t: t[0])
 
+    @property
+    def tags(self) -> FrozenSet[str]:
+        """Every category tag this item carries at any point of its timeline."""
+        return self._tags
+
     # ------------------------------------------------------------------
     # Convenience properties (access current entry fields directly)
     # ------------------------------------------------------------------
@@ -162,6 +175,21 @@ class CashFlowItem:
             f"kind={entry.kind!r})"
         )
 
+    def __deepcopy__(self, memo: dict) -> "CashFlowItem":
+        """Copy the timeline list and the time context, sharing everything else.
+
+        Timeline pairs and their entries are immutable, so a shallow list
+        copy is enough.  The time context goes through *memo*, so items
+        cloned together keep sharing a single (new) context.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone._timeline = list(self._timeline)
+        clone._tags = self._tags
+        clone._tag_revision = self._tag_revision
+        clone._time_ctx = copy.deepcopy(self._time_ctx, memo)
+        return clone
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, CashFlowEntry):
             return self.resolve() == other
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import List, Optional
 
 from ..billing_cycle import BaseBillingCycle, MonthlyBillingCycle, Statement
-from ..cash_flow import CashFlow, CashFlowEntry, CashFlowItem
+from ..cash_flow import CashFlow, CashFlowEntry, CashFlowItem, CashFlowQuery
 from ..interest_rate import InterestRate
 from ..money import Money
 from ..time_context import TimeContext
@@ -364,7 +364,7 @@ class CreditCard:
     def _sum_category_between(self, category: str, after: datetime, up_to: datetime) -> Money:
         """Sum item amounts for *category* in the half-open interval (after, up_to]."""
         return (
-            self.cash_flow.query.filter_by(category=category)
+            CashFlowQuery(self.cash_flow.entries_by_category(category))
             .filter_by(datetime__gt=after, datetime__lte=up_to)
             .sum_amounts()
         )
@@ -51,12 +51,13 @@ def generate_biweekly_dates(start_date: datetime, num_payments: int) -> List[dat
     if num_payments <= 0:
         raise ValueError("Number of payments must be positive")
 
+    step = timedelta(days=14)
     dates = []
     current_date = start_date
 
     for _ in range(num_payments):
         dates.append(current_date)
-        current_date += timedelta(days=14)
+        current_date += step
 
     return dates
 
@@ -81,12 +82,13 @@ def generate_weekly_dates(start_date: datetime, num_payments: int) -> List[datet
     if num_payments <= 0:
         raise ValueError("Number of payments must be positive")
 
+    step = timedelta(days=7)
     dates = []
     current_date = start_date
 
     for _ in range(num_payments):
         dates.append(current_date)
-        current_date += timedelta(days=7)
+        current_date += step
 
     return dates
 
@@ -161,11 +163,12 @@ def generate_custom_interval_dates(start_date: datetime, num_payments: int, inte
     if interval_days <= 0:
         raise ValueError("Interval days must be positive")
 
+    step = timedelta(days=interval_days)
     dates = []
     current_date = start_date
 
     for _ in range(num_payments):
         dates.append(current_date)
-        current_date += timedelta(days=interval_days)
+        current_date += step
 
     return dates
@@ -23,19 +23,18 @@ def allocate_payment(
     Returns:
         (fine_paid, mora_paid, interest_paid, principal_paid)
     """
-    remaining = amount
+    remaining = amount.raw_amount
 
-    fine_paid = Money(min(fines_owed.raw_amount, remaining.raw_amount))
-    remaining = remaining - fine_paid
+    fine_paid = min(fines_owed.raw_amount, remaining)
+    remaining -= fine_paid
 
-    mora_paid = Money(min(mora_accrued.raw_amount, remaining.raw_amount))
-    remaining = remaining - mora_paid
+    mora_paid = min(mora_accrued.raw_amount, remaining)
+    remaining -= mora_paid
 
-    interest_paid = Money(min(interest_accrued.raw_amount, remaining.raw_amount))
-    remaining = remaining - interest_paid
+    interest_paid = min(interest_accrued.raw_amount, remaining)
+    remaining -= interest_paid
 
-    principal_paid = remaining
-    return fine_paid, mora_paid, interest_paid, principal_paid
+    return Money(fine_paid), Money(mora_paid), Money(interest_paid), Money(remaining)
 
 
 def distribute_into_installments(
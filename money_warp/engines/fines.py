@@ -1,6 +1,9 @@
 """Fine computation and late-payment detection."""
 
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, timedelta, tzinfo
+from decimal import Decimal
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 from ..interest_rate import InterestRate
@@ -13,6 +16,8 @@ from .constants import BALANCE_TOLERANCE
 _WINDOW_DAYS_BEFORE = 3
 _WINDOW_DAYS_AFTER = 1
 
+_payment_datetime = attrgetter("datetime")
+
 
 def is_payment_late(
     due_date: date,
@@ -27,17 +32,16 @@ def is_payment_late(
     the original due date falls on a non-working day.
     """
     penalty_due = effective_penalty_due_date(due_date, calendar)
-    effective_due = penalty_due + timedelta(days=grace_period_days)
-    return to_date(as_of, tz) > effective_due
+    return to_date(as_of, tz).toordinal() - penalty_due.toordinal() > grace_period_days
 
 
 def _has_payment_near(
     due_date: date,
     as_of: datetime,
-    schedule: PaymentSchedule,
-    payment_entries: list,
+    expected: Money,
+    visible_payments: list,
+    paid_by_date: Dict[date, Decimal],
     tz: tzinfo,
-    schedule_due_date: Optional[date] = None,
 ) -> bool:
     """Check if sufficient payment has been made near a due date.
 
@@ -47,29 +51,26 @@ def _has_payment_near(
     Args:
         due_date: The date to center the payment window on (may be
             the effective penalty due date).
-        schedule_due_date: When provided, used for the schedule-entry
-            lookup instead of *due_date*.  This allows the window to
-            be centered on the effective date while looking up the
-            expected amount from the original schedule date.
+        expected: The scheduled payment amount for the original due
+            date.  A zero amount never counts as covered.
+        visible_payments: Payment entries made on or before *as_of*,
+            sorted by datetime.
+        paid_by_date: Raw amount paid per local calendar date, built
+            once from *visible_payments*.
     """
-    lookup_date = schedule_due_date if schedule_due_date is not None else due_date
-
-    expected = Money.zero()
-    for entry in schedule:
-        if entry.due_date == lookup_date:
-            expected = entry.payment_amount
-            break
     if expected.is_zero():
         return False
 
-    exact = [p for p in payment_entries if to_date(p.datetime, tz) == due_date and p.datetime <= as_of]
-    if sum((p.amount for p in exact), Money.zero()) >= (expected - BALANCE_TOLERANCE):
+    threshold = expected - BALANCE_TOLERANCE
+    if Money(paid_by_date.get(due_date, Decimal("0"))) >= threshold:
         return True
 
     window_start = to_datetime(due_date - timedelta(days=_WINDOW_DAYS_BEFORE), tz)
     window_end = min(as_of, to_datetime(due_date + timedelta(days=_WINDOW_DAYS_AFTER), tz))
-    window = [p for p in payment_entries if window_start <= p.datetime <= window_end and p.datetime <= as_of]
-    return sum((p.amount for p in window), Money.zero()) >= (expected - BALANCE_TOLERANCE)
+    first = bisect_left(visible_payments, window_start, key=_payment_datetime)
+    last = bisect_right(visible_payments, window_end, lo=first, key=_payment_datetime)
+    window_total = sum((p.amount.raw_amount for p in visible_payments[first:last]), Decimal("0"))
+    return Money(window_total) >= threshold
 
 
 def compute_fines_at(
@@ -91,21 +92,37 @@ def compute_fines_at(
     When the original due date falls on a non-working day, the
     effective due date is shifted to the next working day for both
     the lateness check and the payment proximity window.
+
+    *payment_entries* may come in any order. They are sorted by datetime
+    once (linear when already sorted, as the forward pass and ``Loan``
+    provide them), so the payments visible at *as_of* and those inside
+    each proximity window are found by bisection.
     """
     fines = dict(existing_fines)
+    expected_by_due_date = {entry.due_date: entry.payment_amount for entry in schedule}
+    as_of_ordinal = to_date(as_of, tz).toordinal()
+    visible_payments: Optional[list] = None
+    paid_by_date: Dict[date, Decimal] = {}
 
     for dd in due_dates:
         if dd in fines:
             continue
-        if not is_payment_late(dd, grace_period_days, as_of, tz, calendar):
-            continue
         penalty_dd = effective_penalty_due_date(dd, calendar)
-        if _has_payment_near(penalty_dd, as_of, schedule, payment_entries, tz, schedule_due_date=dd):
+        if as_of_ordinal - penalty_dd.toordinal() <= grace_period_days:
+            continue
+        expected = expected_by_due_date.get(dd)
+        if expected is None:
+            continue
+        if visible_payments is None:
+            # Built on the first overdue date only: each payment's local
+            # date is resolved once instead of once per overdue due date.
+            ordered = sorted(payment_entries, key=_payment_datetime)
+            visible_payments = ordered[: bisect_right(ordered, as_of, key=_payment_datetime)]
+            for p in visible_payments:
+                paid_on = to_date(p.datetime, tz)
+                paid_by_date[paid_on] = paid_by_date.get(paid_on, Decimal("0")) + p.amount.raw_amount
+        if _has_payment_near(penalty_dd, as_of, expected, visible_payments, paid_by_date, tz):
             continue
-        for entry in schedule:
-            if entry.due_date == dd:
-                fine_amount = Money(entry.payment_amount.raw_amount * fine_rate.as_decimal())
-                fines[dd] = fine_amount
-                break
+        fines[dd] = Money(expected.raw_amount * fine_rate.as_decimal())
 
     return fines
@@ -157,13 +157,14 @@ def _build_event_timeline(
 
     Returns a list of ``(datetime, is_payment, payment_or_none)`` tuples
     sorted chronologically.  Payments sort before observations at the
-    same timestamp.
+    same timestamp.  Repeated observation dates collapse into a single
+    event, since observing fines twice at the same instant is a no-op.
     """
     events: List[Tuple[datetime, bool, Optional[object]]] = []
     for payment in payment_entries:
         events.append((payment.datetime, True, payment))
     if fine_observation_dates:
-        for dt in fine_observation_dates:
+        for dt in set(fine_observation_dates):
             events.append((dt, False, None))
     events.sort(key=lambda e: (e[0], not e[1]))
     return events
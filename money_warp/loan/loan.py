@@ -1,8 +1,11 @@
 """Loan class -- everything emerges from the CashFlow."""
 
+import copy
+import dataclasses
 import warnings
+from bisect import bisect_left
 from datetime import date, datetime, tzinfo
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 from zoneinfo import ZoneInfo
 
 from ..cash_flow import CashFlow, CashFlowItem, CashFlowType
@@ -27,6 +30,26 @@ from ..tz import ensure_aware, get_tz, tz_aware
 from ..working_day import EveryDayCalendar, WorkingDayCalendar, effective_penalty_due_date
 from .tvm import loan_calculate_anticipation, loan_irr, loan_present_value
 
+# Caches keyed on the current time; ``__deepcopy__`` leaves them out of clones.
+_TIME_KEYED_CACHES = frozenset({"_amortization_cache", "_state_cache"})
+
+
+def _payment_entries_key(entries: list) -> tuple:
+    """Cache key for payment entries, built from their exact values.
+
+    ``CashFlowEntry`` equality compares ``Money`` rounded to cents, so two
+    payments a fraction of a cent apart would produce the same key.
+    """
+    return tuple((e.datetime, e.amount.raw_amount, e.interest_date, e.category) for e in entries)
+
+
+def _copy_schedule(schedule: PaymentSchedule) -> PaymentSchedule:
+    """A new schedule with copied entries, so a cached schedule never reaches callers."""
+    return PaymentSchedule(
+        entries=[dataclasses.replace(entry) for entry in schedule],
+        totals=(schedule.total_payments, schedule.total_interest, schedule.total_principal),
+    )
+
 
 class Loan:
     """Represents a personal loan where everything emerges from the CashFlow.
@@ -86,7 +109,8 @@ class Loan:
         self.mora_interest_rate = mora_interest_rate or interest_rate
         self.mora_strategy = mora_strategy
         self._interest = InterestCalculator(interest_rate, self.mora_interest_rate, mora_strategy)
-        self.due_dates = sorted(due_dates)
+        dates = list(due_dates)
+        self.due_dates = dates if all(a <= b for a, b in zip(dates, dates[1:])) else sorted(dates)
         self.disbursement_date = (
             disbursement_date if disbursement_date is not None else ensure_aware(self._time_ctx.now())
         )
@@ -100,6 +124,10 @@ class Loan:
         self.taxes: List[BaseTax] = taxes or []
         self.is_grossed_up = is_grossed_up
         self._tax_cache: Optional[Dict[str, TaxResult]] = None
+        self._schedule_cache: Optional[PaymentSchedule] = None
+        self._expected_payment_cache: Optional[Dict[date, Money]] = None
+        self._amortization_cache: Optional[Tuple[tuple, PaymentSchedule]] = None
+        self._state_cache: Optional[Tuple[tuple, LoanState]] = None
         self._fine_observation_dates: List[datetime] = []
 
         self.cashflow = self._build_initial_cashflow()
@@ -110,33 +138,23 @@ class Loan:
 
     def _build_initial_cashflow(self) -> CashFlow:
         """Build the initial CashFlow with expected items from the schedule."""
-        items: List[CashFlowItem] = []
         ctx = self._time_ctx
         expected = CashFlowType.EXPECTED
 
         total_tax = self.total_tax
-        if total_tax.is_positive() and self.is_grossed_up:
-            items.append(
-                CashFlowItem(
-                    self.net_disbursement,
-                    self.disbursement_date,
-                    "Loan disbursement",
-                    "disbursement",
-                    kind=expected,
-                    time_context=ctx,
-                )
-            )
-        elif total_tax.is_positive():
-            items.append(
-                CashFlowItem(
-                    self.principal,
-                    self.disbursement_date,
-                    "Loan disbursement",
-                    "disbursement",
-                    kind=expected,
-                    time_context=ctx,
-                )
+        has_tax = total_tax.is_positive()
+        disbursed = self.net_disbursement if has_tax and self.is_grossed_up else self.principal
+        items: List[CashFlowItem] = [
+            CashFlowItem(
+                disbursed,
+                self.disbursement_date,
+                "Loan disbursement",
+                "disbursement",
+                kind=expected,
+                time_context=ctx,
             )
+        ]
+        if has_tax and not self.is_grossed_up:
             items.append(
                 CashFlowItem(
                     Money(-total_tax.raw_amount),
@@ -147,22 +165,13 @@ class Loan:
                     time_context=ctx,
                 )
             )
-        else:
-            items.append(
-                CashFlowItem(
-                    self.principal,
-                    self.disbursement_date,
-                    "Loan disbursement",
-                    "disbursement",
-                    kind=expected,
-                    time_context=ctx,
-                )
-            )
 
-        schedule = self.get_original_schedule()
-        for entry in schedule:
-            due_dt = self._time_ctx.to_datetime(entry.due_date)
-            items.append(
+        schedule = self._original_schedule()
+        due_datetimes = [ctx.to_datetime(entry.due_date) for entry in schedule]
+        items.extend(
+            item
+            for entry, due_dt in zip(schedule, due_datetimes)
+            for item in (
                 CashFlowItem(
                     Money(-entry.interest_payment.raw_amount),
                     due_dt,
@@ -170,9 +179,7 @@ class Loan:
                     "interest",
                     kind=expected,
                     time_context=ctx,
-                )
-            )
-            items.append(
+                ),
                 CashFlowItem(
                     Money(-entry.principal_payment.raw_amount),
                     due_dt,
@@ -180,8 +187,9 @@ class Loan:
                     "principal",
                     kind=expected,
                     time_context=ctx,
-                )
+                ),
             )
+        )
 
         return CashFlow(items)
 
@@ -268,20 +276,18 @@ class Loan:
             description=description,
         )
 
-        schedule = self.get_original_schedule()
-        for entry in schedule:
-            if entry.due_date == next_due:
-                apply_tolerance_adjustment(
-                    self.cashflow,
-                    entry,
-                    settlement,
-                    payment_date,
-                    interest_date,
-                    self.payment_tolerance,
-                    len(self.due_dates),
-                    self._time_ctx,
-                )
-                break
+        entry = self._original_schedule_entry(next_due)
+        if entry is not None:
+            apply_tolerance_adjustment(
+                self.cashflow,
+                entry,
+                settlement,
+                payment_date,
+                interest_date,
+                self.payment_tolerance,
+                len(self.due_dates),
+                self._time_ctx,
+            )
 
         return settlement
 
@@ -334,26 +340,44 @@ class Loan:
     # Derived state (computed from CashFlow)
     # ------------------------------------------------------------------
 
-    def _compute_state(self) -> LoanState:
-        """Run the forward pass over all payments to derive loan state."""
-        return compute_state(
+    def _compute_state(self, now: Optional[datetime] = None) -> LoanState:
+        """Run the forward pass over all payments to derive loan state.
+
+        Callers that also need the current time pass it as *now* so a
+        single clock read serves the whole computation.
+
+        The state is cached against everything the forward pass reads
+        besides the loan terms -- the time, the active payment entries,
+        and the fine observation dates -- so consecutive property reads
+        at the same time (e.g. inside a Warp) share one pass.
+        """
+        if now is None:
+            now = self.now()
+        payment_entries = self._payment_entries()
+        key = (now, _payment_entries_key(payment_entries), tuple(self._fine_observation_dates))
+        if self._state_cache is not None and self._state_cache[0] == key:
+            return self._state_cache[1]
+
+        state = compute_state(
             self.principal,
             self._interest,
-            self.get_original_schedule(),
+            self._original_schedule(),
             self.due_dates,
             self.fine_rate,
             self.grace_period_days,
             self.disbursement_date,
-            self._payment_entries(),
-            self.now(),
+            payment_entries,
+            now,
             tz=self._time_ctx.tz,
             fine_observation_dates=self._fine_observation_dates,
             calendar=self.working_day_calendar,
         )
+        self._state_cache = (key, state)
+        return state
 
     def _payment_entries(self) -> list:
         """Payment CashFlowEntry objects from the cashflow, sorted by datetime."""
-        entries = [e for e in self.cashflow.items() if "payment" in e.category]
+        entries = self.cashflow.entries_by_category("payment")
         return sorted(entries, key=lambda e: e.datetime)
 
     # ------------------------------------------------------------------
@@ -363,18 +387,19 @@ class Loan:
     @property
     def settlements(self) -> List[Settlement]:
         """All settlements (derived from CashFlow)."""
-        return self._compute_state().settlements
+        return list(self._compute_state().settlements)
 
     @property
     def installments(self) -> List[Installment]:
         """The repayment plan as Installment objects (derived from CashFlow)."""
-        state = self._compute_state()
+        now = self.now()
+        state = self._compute_state(now)
         return build_installments(
-            self.get_original_schedule(),
+            self._original_schedule(),
             state.settlements,
             state.fines_applied,
             state.principal_balance,
-            self.now(),
+            now,
             self._interest,
             state.last_accrual_end,
             tz=self._time_ctx.tz,
@@ -390,13 +415,15 @@ class Loan:
         """Outstanding principal (derived from CashFlow)."""
         return self._compute_state().principal_balance
 
-    def _accrued_interest_components(self) -> tuple:
+    def _accrued_interest_components(self, now: Optional[datetime] = None) -> tuple:
         """Return (regular, mora) accrued interest since last payment."""
-        state = self._compute_state()
-        days = (self._time_ctx.to_date(self.now()) - self._time_ctx.to_date(state.last_accrual_end)).days
+        if now is None:
+            now = self.now()
+        state = self._compute_state(now)
+        days = (self._time_ctx.to_date(now) - self._time_ctx.to_date(state.last_accrual_end)).days
 
         if state.principal_balance.is_positive() and days > 0:
-            covered = covered_due_date_count(state.principal_balance, self.get_original_schedule())
+            covered = covered_due_date_count(state.principal_balance, self._original_schedule())
             next_due = self.due_dates[covered] if covered < len(self.due_dates) else None
             penalty_next_due = effective_penalty_due_date(next_due, self.working_day_calendar) if next_due else None
             return self._interest.compute_accrued_interest(
@@ -422,7 +449,11 @@ class Loan:
     @property
     def fine_balance(self) -> Money:
         """Unpaid fine amount (derived from CashFlow)."""
-        state = self._compute_state()
+        return self._outstanding_fines(self._compute_state())
+
+    @staticmethod
+    def _outstanding_fines(state: LoanState) -> Money:
+        """Applied fines not yet paid, floored at zero."""
         total_fines = (
             Money(sum(f.raw_amount for f in state.fines_applied.values())) if state.fines_applied else Money.zero()
         )
@@ -432,12 +463,16 @@ class Loan:
     @property
     def current_balance(self) -> Money:
         """Total outstanding balance (principal + interest + mora + fines)."""
-        return self.principal_balance + self.interest_balance + self.mora_interest_balance + self.fine_balance
+        now = self.now()
+        state = self._compute_state(now)
+        interest, mora = self._accrued_interest_components(now)
+        return state.principal_balance + interest + mora + self._outstanding_fines(state)
 
     @property
     def is_paid_off(self) -> bool:
         """Whether the loan is fully paid off."""
-        return self.current_balance.is_zero() or self.current_balance.is_negative()
+        balance = self.current_balance
+        return balance.is_zero() or balance.is_negative()
 
     @property
     def overpaid(self) -> Money:
@@ -451,7 +486,7 @@ class Loan:
     @property
     def fines_applied(self) -> Dict[date, Money]:
         """Fine amounts applied per due date (derived from CashFlow)."""
-        return self._compute_state().fines_applied
+        return dict(self._compute_state().fines_applied)
 
     @fines_applied.setter
     def fines_applied(self, value: Dict[date, Money]) -> None:
@@ -504,11 +539,26 @@ class Loan:
 
     def days_since_last_payment(self) -> int:
         """Days since the last payment (Warp-aware)."""
-        return (self._time_ctx.to_date(self.now()) - self._time_ctx.to_date(self.last_payment_date)).days
+        now = self.now()
+        last_payment_date = self._compute_state(now).last_payment_date
+        return (self._time_ctx.to_date(now) - self._time_ctx.to_date(last_payment_date)).days
 
     def _covered_due_date_count(self) -> int:
         """How many due dates have been covered by payments."""
-        return covered_due_date_count(self.principal_balance, self.get_original_schedule())
+        return covered_due_date_count(self.principal_balance, self._original_schedule())
+
+    def _original_schedule_entry(self, due_date: date) -> Optional[PaymentScheduleEntry]:
+        """The original schedule entry for *due_date*, or ``None`` if it has none.
+
+        The built-in schedulers emit one entry per due date in ``due_dates``
+        order, so the entry is found by bisection; a custom scheduler that
+        breaks that layout falls back to a linear search.
+        """
+        schedule = self._original_schedule()
+        index = bisect_left(self.due_dates, due_date)
+        if index < len(schedule) and schedule[index].due_date == due_date:
+            return schedule[index]
+        return next((entry for entry in schedule if entry.due_date == due_date), None)
 
     def _next_unpaid_due_date(self) -> date:
         """Find the next due date that hasn't been fully paid.
@@ -556,31 +606,62 @@ class Loan:
 
     def get_expected_payment_amount(self, due_date: date) -> Money:
         """Get the expected payment amount for a specific due date."""
-        schedule = self.get_original_schedule()
-        for entry in schedule:
-            if entry.due_date == due_date:
-                return entry.payment_amount
-        raise ValueError(f"Due date {due_date} is not in loan's due dates")
+        if self._expected_payment_cache is None:
+            self._expected_payment_cache = {entry.due_date: entry.payment_amount for entry in self._original_schedule()}
+        try:
+            return self._expected_payment_cache[due_date]
+        except KeyError:
+            raise ValueError(f"Due date {due_date} is not in loan's due dates") from None
 
     # ------------------------------------------------------------------
     # Schedule
     # ------------------------------------------------------------------
 
     def get_original_schedule(self) -> PaymentSchedule:
-        """The original amortization schedule (static, ignores payments)."""
-        return self.scheduler.generate_schedule(
+        """The original amortization schedule (static, ignores payments).
+
+        Each call returns a new ``PaymentSchedule`` with its own entries,
+        so callers may modify it without affecting the loan.
+        """
+        return _copy_schedule(self._original_schedule())
+
+    def _original_schedule(self) -> PaymentSchedule:
+        """The cached original schedule, for read-only internal use.
+
+        It depends only on the loan terms, so it is generated once and
+        shared with Warp clones; it must never be handed to callers.
+        """
+        if self._schedule_cache is not None:
+            return self._schedule_cache
+
+        self._schedule_cache = self.scheduler.generate_schedule(
             self.principal,
             self.interest_rate,
             self.due_dates,
             self.disbursement_date,
             self._time_ctx.tz,
         )
+        return self._schedule_cache
 
     def get_amortization_schedule(self) -> PaymentSchedule:
-        """Current schedule: recorded past entries + projected future."""
-        state = self._compute_state()
+        """Current schedule: recorded past entries + projected future.
+
+        The schedule is cached against everything it derives from -- the
+        current time, the active payment entries, and the fine observation
+        dates -- so repeated calls between mutations skip rebuilding it.
+        Each call returns a new ``PaymentSchedule`` with its own entries,
+        so callers may modify it without affecting the cache.
+        """
+        now = self.now()
+        key = (now, _payment_entries_key(self._payment_entries()), tuple(self._fine_observation_dates))
+        if self._amortization_cache is None or self._amortization_cache[0] != key:
+            self._amortization_cache = (key, self._build_amortization_schedule(now))
+        return _copy_schedule(self._amortization_cache[1])
+
+    def _build_amortization_schedule(self, now: datetime) -> PaymentSchedule:
+        state = self._compute_state(now)
         if not state.settlements:
-            return self.get_original_schedule()
+            return self._original_schedule()
 
         actual_entries: List[PaymentScheduleEntry] = []
         prev_balance = self.principal
@@ -603,7 +684,7 @@ class Loan:
             prev_balance = s.remaining_balance
             prev_date = s.payment_date
 
-        covered = covered_due_date_count(state.principal_balance, self.get_original_schedule())
+        covered = covered_due_date_count(state.principal_balance, self._original_schedule())
         remaining_due_dates = self.due_dates[covered:]
         if not remaining_due_dates:
             return PaymentSchedule(entries=actual_entries)
@@ -665,6 +746,26 @@ class Loan:
     # Dunder
     # ------------------------------------------------------------------
 
+    def __deepcopy__(self, memo: dict) -> "Loan":
+        """Clone the loan, sharing internal construction-time caches with the clone.
+
+        The original schedule and expected-payment map depend only on the
+        loan terms and are never handed to callers, so every Warp clone
+        reuses them instead of copying them again. The tax results are
+        returned directly by ``tax_amounts`` and are copied like any other
+        attribute.
+        """
+        for cached in (self._schedule_cache, self._expected_payment_cache):
+            if cached is not None:
+                memo[id(cached)] = cached
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            # The time-keyed caches never match a Warp clone, whose time
+            # always differs, so the clone starts without them.
+            setattr(clone, name, None if name in _TIME_KEYED_CACHES else copy.deepcopy(value, memo))
+        return clone
+
     def __str__(self) -> str:
         fine_info = f", fines={self.fine_balance}" if self.fine_balance.is_positive() else ""
         return (
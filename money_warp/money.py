@@ -4,6 +4,18 @@ import numbers
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Union
 
+_CENT = Decimal("0.01")
+
+
+def _as_decimal(value: Union[Decimal, str, int, float]) -> Decimal:
+    """Convert an operand to Decimal without a ``str`` round-trip when it is exact."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, str)):
+        return Decimal(value)
+    # Convert float (and other numerics) to string first to avoid precision issues
+    return Decimal(str(value))
+
 
 class Money:
     """
@@ -14,6 +26,8 @@ class Money:
     and comparisons.
     """
 
+    __slots__ = ("_amount",)
+
     def __init__(self, amount: Union[Decimal, str, int, float]) -> None:
         """
         Create a Money object with high internal precision.
@@ -21,15 +35,16 @@ class Money:
         Args:
             amount: The monetary amount (will be converted to Decimal)
         """
-        if isinstance(amount, float):
-            # Convert float to string first to avoid precision issues
-            self._amount = Decimal(str(amount))
-        else:
-            self._amount = Decimal(amount)
+        self._amount = _as_decimal(amount)
 
     @classmethod
     def zero(cls) -> "Money":
-        """Create zero money."""
+        """Zero money.
+
+        Money is immutable, so plain ``Money`` shares one cached instance.
+        """
+        if cls is Money:
+            return _ZERO
         return cls(0)
 
     @classmethod
@@ -39,6 +54,11 @@ class Money:
 
     def __add__(self, other: "Money") -> "Money":
         """Add two Money objects."""
+        # Money is immutable, so adding the shared zero can return the other operand
+        if other is _ZERO:
+            return self
+        if self is _ZERO and isinstance(other, Money):
+            return other
         return Money(self._amount + other._amount)
 
     def __sub__(self, other: "Money") -> "Money":
@@ -47,28 +67,28 @@ class Money:
 
     def __mul__(self, factor: Union[Decimal, int, float]) -> "Money":
         """Multiply by a number - keeps high precision."""
-        return Money(self._amount * Decimal(str(factor)))
+        return Money(self._amount * _as_decimal(factor))
 
     def __truediv__(self, divisor: Union[Decimal, int, float]) -> "Money":
         """Divide by a number - keeps high precision."""
-        return Money(self._amount / Decimal(str(divisor)))
+        return Money(self._amount / _as_decimal(divisor))
 
     def __radd__(self, other: Union[Decimal, int, float]) -> "Money":
         """Support numeric + Money (e.g. Decimal + Money)."""
         if isinstance(other, (Decimal, int, float)):
-            return Money(Decimal(str(other)) + self._amount)
+            return Money(_as_decimal(other) + self._amount)
         return NotImplemented
 
     def __rsub__(self, other: Union[Decimal, int, float]) -> "Money":
         """Support numeric - Money (e.g. Decimal - Money)."""
         if isinstance(other, (Decimal, int, float)):
-            return Money(Decimal(str(other)) - self._amount)
+            return Money(_as_decimal(other) - self._amount)
         return NotImplemented
 
     def __rmul__(self, factor: Union[Decimal, int, float]) -> "Money":
         """Support numeric * Money (e.g. float * Money)."""
         if isinstance(factor, (Decimal, int, float)):
-            return Money(self._amount * Decimal(str(factor)))
+            return Money(self._amount * _as_decimal(factor))
         return NotImplemented
 
     def __neg__(self) -> "Money":
@@ -88,11 +108,13 @@ class Money:
         if isinstance(other, Money):
             return other.real_amount
         if isinstance(other, (Decimal, int, float)):
-            return Decimal(str(other))
+            return _as_decimal(other)
         return NotImplemented
 
     def __eq__(self, other: object) -> bool:
         """Compare at 'real money' precision. Accepts Money or Decimal."""
+        if other is _ZERO:
+            return self.is_zero()
         value = self._compare_value(other)
         if value is NotImplemented:
             return NotImplemented
@@ -134,7 +156,7 @@ class Money:
     @property
     def real_amount(self) -> Decimal:
         """Get the 'real money' amount rounded to 2 decimal places."""
-        return self._amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return self._amount.quantize(_CENT, rounding=ROUND_HALF_UP)
 
     @property
     def cents(self) -> int:
@@ -165,9 +187,19 @@ class Money:
         """Developer representation showing internal precision."""
         return f"Money({self._amount})"
 
+    def __copy__(self) -> "Money":
+        """Money is immutable, so a copy is the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Money":
+        """Money is immutable, so a deep copy is the same instance."""
+        return self
+
     def debug_precision(self) -> str:
         """Show both internal and real amounts for debugging."""
         return f"Internal: {self._amount}, Real: {self.real_amount}"
 
 
+_ZERO = Money(0)
+
 numbers.Real.register(Money)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Callable, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from scipy.optimize import brentq, fsolve  # type: ignore[import]
 
@@ -61,33 +61,30 @@ def present_value(cash_flow: CashFlow, discount_rate: Rate, valuation_date: Opti
         raise ValueError("Cannot calculate present value: no cash flows or invalid valuation date")
 
     # Convert discount rate to daily rate for precise calculations
-    daily_rate = discount_rate.to_daily().as_decimal()
+    growth = Decimal("1") + discount_rate.to_daily().as_decimal()
 
-    total_pv = Money.zero()
+    # Items sharing a date (e.g. interest and principal of one installment)
+    # reuse the same factor; amounts are summed as raw Decimals.
+    factors: Dict[int, Decimal] = {}
+    total_raw = Decimal("0")
 
     for item in cash_flow.items():
         # Calculate days from valuation date to cash flow date
         days = (item.datetime - valuation_date).days
 
-        if days < 0:
-            # Cash flow is in the past relative to valuation date
-            # This could happen if valuation_date is after some cash flows
-            # We'll treat past cash flows as having zero time value
-            days = 0
+        # Past cash flows (relative to valuation_date) and same-day cash
+        # flows have no time value: PV = CF
+        if days <= 0:
+            total_raw += item.amount.raw_amount
+            continue
 
-        # Calculate present value of this cash flow
         # PV = CF / (1 + daily_rate)^days
-        if days == 0:
-            # No discounting needed for same-day cash flows
-            pv_amount = item.amount
-        else:
-            # Discount the cash flow
-            discount_factor = (Decimal("1") + daily_rate) ** Decimal(str(days))
-            pv_amount = Money(item.amount.raw_amount / discount_factor)
-
-        total_pv += pv_amount
+        factor = factors.get(days)
+        if factor is None:
+            factor = factors[days] = growth**days
+        total_raw += item.amount.raw_amount / factor
 
-    return total_pv
+    return Money(total_raw)
 
 
 def present_value_of_annuity(
@@ -135,19 +132,18 @@ def present_value_of_annuity(
         # PV = PMT x n
         return payment_amount * periods
 
-    # Calculate PV factor for ordinary annuity
+    # Closed form for an ordinary annuity: one power, no per-period loop
     # PV_factor = (1 - (1 + r)^(-n)) / r
-    discount_factor = (Decimal("1") + periodic_rate) ** (-Decimal(str(periods)))
-    pv_factor = (Decimal("1") - discount_factor) / periodic_rate
-
-    # Calculate present value
-    pv = Money(payment_amount.raw_amount * pv_factor)
+    growth = Decimal("1") + periodic_rate
+    exponent = periods if isinstance(periods, int) else Decimal(str(periods))
+    pv_factor = (Decimal("1") - growth**-exponent) / periodic_rate
+    pv_raw = payment_amount.raw_amount * pv_factor
 
     # Adjust for annuity due (payments at beginning of period)
     if payment_timing.lower() in ("begin", "beginning", "due"):
-        pv = Money(pv.raw_amount * (Decimal("1") + periodic_rate))
+        pv_raw *= growth
 
-    return pv
+    return Money(pv_raw)
 
 
 def present_value_of_perpetuity(payment_amount: Money, interest_rate: InterestRate) -> Money:
@@ -211,13 +207,25 @@ def discount_factor(interest_rate: Rate, periods: Union[int, Decimal]) -> Decima
         return Decimal("1")
 
     rate = interest_rate.as_decimal()
-    return Decimal("1") / ((Decimal("1") + rate) ** Decimal(str(periods)))
+    # Whole periods go straight to Decimal's integer power; only fractional
+    # periods need the string round-trip.
+    exponent = periods if isinstance(periods, int) else Decimal(str(periods))
+    return Decimal("1") / ((Decimal("1") + rate) ** exponent)
 
 
 def _npv_function_factory(
     cash_flow: CashFlow, valuation_date: datetime, year_size: YearSize = YearSize.commercial
 ) -> Callable[[float], float]:
-    """Create NPV function for IRR calculation."""
+    """Create NPV function for IRR calculation.
+
+    The cash flow is frozen once into (amount, year fraction) float pairs so
+    each evaluation by the root finder is a plain float sum.
+    """
+    days_per_year = year_size.value
+    terms = [
+        (float(item.amount.raw_amount), max((item.datetime - valuation_date).days, 0) / days_per_year)
+        for item in cash_flow.items()
+    ]
 
     def npv_function(rate_decimal: float) -> float:
         """Calculate NPV for a given rate (as decimal). IRR is where this equals zero."""
@@ -228,10 +236,9 @@ def _npv_function_factory(
             return -1e10
 
         # Handle both scalar and array inputs from scipy
-        rate_percentage = rate_decimal.item() * 100 if hasattr(rate_decimal, "item") else float(rate_decimal) * 100  # type: ignore[attr-defined]
-        test_rate = Rate(f"{rate_percentage:.10f}% annual", year_size=year_size)
-        npv = present_value(cash_flow, test_rate, valuation_date)
-        return float(npv.raw_amount)
+        rate = rate_decimal.item() if hasattr(rate_decimal, "item") else float(rate_decimal)  # type: ignore[attr-defined]
+        growth = 1.0 + rate
+        return sum(amount * growth**-years for amount, years in terms)
 
     return npv_function
 
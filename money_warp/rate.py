@@ -108,6 +108,8 @@ class Rate:
         self._str_decimals = str_decimals
         self._abbrev_labels = abbrev_labels
         self._abbrev_map: Dict[CompoundingFrequency, str] = {**_ABBREV_MAP, **(abbrev_labels or {})}
+        self._daily_rate: Optional[Rate] = None
+        self._monthly_rate: Optional[Rate] = None
 
         if isinstance(rate, str):
             parsed_rate = self._parse_rate_string(rate)
@@ -249,15 +251,21 @@ class Rate:
         return self.period.value
 
     def to_daily(self) -> "Rate":
-        """Convert to daily rate."""
+        """Convert to daily rate.
+
+        The conversion is computed once and cached, since rates are not
+        mutated after construction.
+        """
         if self.period == CompoundingFrequency.DAILY:
             return self
+        if self._daily_rate is not None:
+            return self._daily_rate
 
         effective_annual = self._to_effective_annual()
         days = Decimal(str(self._year_size.value))
         daily_rate = (1 + effective_annual) ** (Decimal("1") / days) - 1
 
-        return self.__class__(
+        self._daily_rate = self.__class__(
             daily_rate,
             CompoundingFrequency.DAILY,
             precision=self._precision,
@@ -267,16 +275,22 @@ class Rate:
             str_decimals=self._str_decimals,
             abbrev_labels=self._abbrev_labels,
         )
+        return self._daily_rate
 
     def to_monthly(self) -> "Rate":
-        """Convert to monthly rate."""
+        """Convert to monthly rate.
+
+        Cached like :meth:`to_daily`.
+        """
         if self.period == CompoundingFrequency.MONTHLY:
             return self
+        if self._monthly_rate is not None:
+            return self._monthly_rate
 
         effective_annual = self._to_effective_annual()
         monthly_rate = (1 + effective_annual) ** (Decimal("1") / Decimal("12")) - 1
 
-        return self.__class__(
+        self._monthly_rate = self.__class__(
             monthly_rate,
             CompoundingFrequency.MONTHLY,
             precision=self._precision,
@@ -286,6 +300,7 @@ class Rate:
             str_decimals=self._str_decimals,
             abbrev_labels=self._abbrev_labels,
         )
+        return self._monthly_rate
 
     def to_annual(self) -> "Rate":
         """Convert to annual rate."""
@@ -336,6 +351,14 @@ class Rate:
 
         return self._quantize((1 + self._decimal_rate) ** Decimal(str(n)) - 1)
 
+    def __copy__(self) -> "Rate":
+        """Rates are never mutated after construction, so a copy is the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Rate":
+        """Rates are never mutated after construction, so a deep copy is the same instance."""
+        return self
+
     def __str__(self) -> str:
         """Clear string representation."""
         label = self._abbrev_map[self.period] if self._str_style == "abbrev" else self.period.name.lower()
@@ -16,6 +16,13 @@ class BaseScheduler(ABC):
     All schedulers should inherit from this and implement the generate_schedule class method.
     """
 
+    @staticmethod
+    def period_days(due_dates: List[date], start: date) -> List[int]:
+        """Days in each period, from *start* to the first due date and between consecutive due dates."""
+        # Differencing proleptic ordinals avoids allocating a timedelta per period.
+        ordinals = [start.toordinal(), *(due_date.toordinal() for due_date in due_dates)]
+        return [current - previous for previous, current in zip(ordinals, ordinals[1:])]
+
     @classmethod
     @abstractmethod
     def generate_schedule(
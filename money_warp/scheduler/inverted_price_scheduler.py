@@ -2,7 +2,7 @@
 
 from datetime import date, datetime, tzinfo
 from decimal import Decimal
-from typing import List
+from typing import Dict, List
 
 from ..interest_rate import InterestRate
 from ..money import Money
@@ -57,21 +57,28 @@ class InvertedPriceScheduler(BaseScheduler):
         # Get daily interest rate
         daily_rate = interest_rate.to_daily().as_decimal()
 
+        # Days since last payment (or disbursement) for every period
+        period_days = cls.period_days(due_dates, to_date(disbursement_date, tz))
+
+        # (1 + daily_rate) is built once, and each distinct period length is
+        # raised once; regular schedules repeat the same length every period.
+        growth = Decimal("1") + daily_rate
+        period_rates: Dict[int, Decimal] = {}
+
         # Generate schedule entries
         entries = []
         remaining_balance = principal.raw_amount
 
-        for i, due_date in enumerate(due_dates):
-            # Calculate days since last payment (or disbursement)
-            prev_date = to_date(disbursement_date, tz) if i == 0 else due_dates[i - 1]
-            days = (due_date - prev_date).days
-
+        for i, (due_date, days) in enumerate(zip(due_dates, period_days)):
             # Store beginning balance
             beginning_balance = remaining_balance
 
             # Calculate interest for this period using compound daily interest
             # Interest = balance * ((1 + daily_rate)^days - 1)
-            interest_amount = remaining_balance * ((Decimal("1") + daily_rate) ** Decimal(str(days)) - Decimal("1"))
+            period_rate = period_rates.get(days)
+            if period_rate is None:
+                period_rate = period_rates[days] = growth**days - Decimal("1")
+            interest_amount = remaining_balance * period_rate
 
             # Principal payment is fixed (except possibly last payment to handle rounding)
             if i == len(due_dates) - 1:
@@ -1,8 +1,10 @@
 """Price scheduler implementing Progressive Price Schedule (French amortization system)."""
 
 from datetime import date, datetime, tzinfo
-from decimal import Decimal
-from typing import List, Optional
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import accumulate
+from operator import mul
+from typing import Dict, List, Optional
 
 from ..interest_rate import InterestRate
 from ..money import Money
@@ -10,6 +12,13 @@ from ..tz import to_date
 from .base import BaseScheduler
 from .schedule import PaymentSchedule, PaymentScheduleEntry
 
+_CENT = Decimal("0.01")
+
+
+def _round_cents(amount: Decimal) -> Decimal:
+    """Round *amount* to cents the way ``Money.real_amount`` does, without building a Money."""
+    return amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+
 
 class PriceScheduler(BaseScheduler):
     """
@@ -60,32 +69,55 @@ class PriceScheduler(BaseScheduler):
         if not due_dates:
             raise ValueError("At least one due date is required")
 
-        return_days = [(due_date - to_date(disbursement_date, tz)).days for due_date in due_dates]
+        period_days = cls.period_days(due_dates, to_date(disbursement_date, tz))
 
-        # Calculate PMT using the reference formula
         daily_rate = interest_rate.to_daily().as_decimal()
-
-        # Create an instance with the loan parameters
-        scheduler = cls(principal.raw_amount, daily_rate, return_days, disbursement_date)
-        pmt = Money(scheduler.calculate_constant_return_pmt()).real_amount
+        zero_rate = daily_rate.is_zero()
+        if zero_rate:
+            # No compounding: every factor is exactly one and the PMT is principal / N.
+            growth_factors = [Decimal("1")] * len(period_days)
+        else:
+            # Regular schedules repeat the same period length, so each distinct
+            # day count is raised once and reused.
+            growth = Decimal("1") + daily_rate
+            factors: Dict[int, Decimal] = {}
+            growth_factors = []
+            for days in period_days:
+                factor = factors.get(days)
+                if factor is None:
+                    factor = factors[days] = growth**days
+                growth_factors.append(factor)
+        period_rates = [factor - Decimal("1") for factor in growth_factors]
+
+        # PMT = principal / sum(1 / (1 + daily_rate)^n for n in return_days).
+        # (1 + daily_rate)^n for each cumulative return day is the running
+        # product of the period growth factors, so no further powers are needed.
+        # A single installment is fully settled by the last-payment branch
+        # below (principal plus one period of interest), so it needs no PMT.
+        pmt = Decimal("0")
+        if len(due_dates) > 1:
+            if zero_rate:
+                # Every discount factor is one, so the sum is just the installment count.
+                denominator = Decimal(len(due_dates))
+            else:
+                denominator = sum((Decimal("1") / factor for factor in accumulate(growth_factors, mul)), Decimal("0"))
+            pmt = _round_cents(principal.raw_amount / denominator)
 
         # Generate schedule entries with step-level rounding.
         # Each intermediate value (interest, principal, balance) is rounded
         # to 2 decimal places before feeding into the next period.
         # The last installment is calculated by difference to guarantee
-        # a zero final balance.
+        # a zero final balance. The recurrence runs on plain Decimals; Money
+        # objects are only built for the entry fields.
         entries = []
         remaining_balance = principal.real_amount
+        total_interest = Decimal("0")
 
-        for i, due_date in enumerate(due_dates):
-            prev_date = to_date(disbursement_date, tz) if i == 0 else due_dates[i - 1]
-            days = (due_date - prev_date).days
-
+        for i, (due_date, days, period_rate) in enumerate(zip(due_dates, period_days, period_rates)):
             beginning_balance = remaining_balance
 
-            interest_amount = Money(
-                remaining_balance * ((Decimal("1") + daily_rate) ** Decimal(str(days)) - Decimal("1"))
-            ).real_amount
+            interest_amount = _round_cents(remaining_balance * period_rate)
+            total_interest += interest_amount
 
             is_last = i == len(due_dates) - 1
             if is_last:
@@ -104,12 +136,21 @@ class PriceScheduler(BaseScheduler):
                 beginning_balance=Money(beginning_balance),
                 payment_amount=Money(total_payment),
                 principal_payment=Money(principal_payment),
-                interest_payment=Money(interest_amount),
+                interest_payment=Money(interest_amount) if interest_amount else Money.zero(),
                 ending_balance=Money(max(Decimal("0"), remaining_balance)),
             )
             entries.append(entry)
 
-        return PaymentSchedule(entries=entries)
+        # The principal payments telescope to the opening balance (the last
+        # one settles whatever remains), so only interest needs a running sum.
+        return PaymentSchedule(
+            entries=entries,
+            totals=(
+                Money(principal.real_amount + total_interest),
+                Money(total_interest),
+                Money(principal.real_amount),
+            ),
+        )
 
     def calculate_constant_return_pmt(self) -> Decimal:
         """
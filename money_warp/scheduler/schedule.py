@@ -1,13 +1,14 @@
 """Payment schedule data structures."""
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import date
-from typing import Iterator, List
+from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
 
 from ..money import Money
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentScheduleEntry:
     """
     Represents a single payment in an amortization schedule.
@@ -45,17 +46,25 @@ class PaymentSchedule:
     total_payments: Money = field(init=False)
     total_interest: Money = field(init=False)
     total_principal: Money = field(init=False)
-
-    def __post_init__(self) -> None:
-        """Calculate totals after initialization."""
-        self.total_payments = Money.zero()
-        self.total_interest = Money.zero()
-        self.total_principal = Money.zero()
-
-        for entry in self.entries:
-            self.total_payments += entry.payment_amount
-            self.total_interest += entry.interest_payment
-            self.total_principal += entry.principal_payment
+    totals: InitVar[Optional[Tuple[Money, Money, Money]]] = None
+
+    def __post_init__(self, totals: Optional[Tuple[Money, Money, Money]]) -> None:
+        """Calculate totals after initialization.
+
+        A scheduler that accumulated the totals while generating the entries
+        can pass them as ``totals`` -- ``(total_payments, total_interest,
+        total_principal)`` -- to skip the column sums; it is responsible for
+        passing totals that match the entries. Otherwise each total is a
+        single Decimal sum over one column, so no intermediate Money objects
+        are created.
+        """
+        if totals is not None:
+            self.total_payments, self.total_interest, self.total_principal = totals
+            return
+        entries = self.entries
+        self.total_payments = Money(sum((e.payment_amount.raw_amount for e in entries), Decimal("0")))
+        self.total_interest = Money(sum((e.interest_payment.raw_amount for e in entries), Decimal("0")))
+        self.total_principal = Money(sum((e.principal_payment.raw_amount for e in entries), Decimal("0")))
 
     def __len__(self) -> int:
         """Number of payments in the schedule."""
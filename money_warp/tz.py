@@ -7,7 +7,7 @@ All datetimes produced by the library are timezone-aware.
 import functools
 import inspect
 from datetime import date, datetime, timezone, tzinfo
-from typing import Callable, TypeVar, Union
+from typing import Callable, List, TypeVar, Union
 from zoneinfo import ZoneInfo
 
 _default_tz: tzinfo = timezone.utc
@@ -46,11 +46,25 @@ def ensure_aware(dt: datetime) -> datetime:
     :func:`to_date` when extracting a calendar date — it converts
     back to the business timezone first.
     """
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is timezone.utc:
+        # Already normalised: every datetime stored by the library takes this path.
+        return dt
+    if tz is None:
         return dt.replace(tzinfo=_default_tz).astimezone(timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+def ensure_aware_many(dts: List[datetime]) -> List[datetime]:
+    """List form of :func:`ensure_aware`.
+
+    The configured timezone is read once for the whole list instead of
+    once per element.
+    """
+    tz = _default_tz
+    return [(dt.replace(tzinfo=tz) if dt.tzinfo is None else dt).astimezone(timezone.utc) for dt in dts]
+
+
 def to_date(dt: Union[date, datetime], tz: tzinfo) -> date:
     """Extract the calendar date in the given timezone.
 
@@ -69,6 +83,15 @@ def to_datetime(d: date, tz: tzinfo) -> datetime:
     return naive.replace(tzinfo=tz).astimezone(timezone.utc)
 
 
+def _coerce_aware(value):
+    """Apply :func:`ensure_aware` to a ``datetime`` or a list of them; pass anything else through."""
+    if isinstance(value, datetime):
+        return ensure_aware(value)
+    if isinstance(value, list) and value and isinstance(value[0], datetime):
+        return ensure_aware_many(value)
+    return value
+
+
 def tz_aware(func: F) -> F:
     """Decorator that makes every ``datetime`` argument timezone-aware.
 
@@ -78,18 +101,28 @@ def tz_aware(func: F) -> F:
     * ``list`` values whose first element is a ``datetime`` are coerced
       element-wise.
     * Everything else is left untouched.
+
+    The signature is inspected once, at decoration time, to find which
+    positions and keyword names map to named parameters; ``*args`` and
+    ``**kwargs`` catch-alls are passed through as-is.  Calls then coerce
+    the arguments directly instead of binding them to the signature.
     """
-    sig = inspect.signature(func)
+    params = inspect.signature(func).parameters.values()
+    positional_count = sum(
+        p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD) for p in params
+    )
+    keyword_names = frozenset(
+        p.name for p in params if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    )
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        bound = sig.bind(*args, **kwargs)
-        for name, value in bound.arguments.items():
-            if isinstance(value, datetime):
-                bound.arguments[name] = ensure_aware(value)
-            elif isinstance(value, list) and value and isinstance(value[0], datetime):
-                bound.arguments[name] = [ensure_aware(v) for v in value]
-        return func(*bound.args, **bound.kwargs)
+        if args:
+            args = (*map(_coerce_aware, args[:positional_count]), *args[positional_count:])
+        for name, value in kwargs.items():
+            if name in keyword_names:
+                kwargs[name] = _coerce_aware(value)
+        return func(*args, **kwargs)
 
     return wrapper  # type: ignore[return-value]
 
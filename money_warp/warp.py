@@ -41,6 +41,28 @@ class InvalidDateError(WarpError):
     pass
 
 
+class InactiveWarpError(WarpError):
+    """Raised when ``advance_to`` is called outside an active Warp context."""
+
+    def __str__(self) -> str:
+        return "advance_to() requires an active Warp context"
+
+
+class BackwardWarpError(InvalidDateError):
+    """Raised when ``advance_to`` is given a date before the current target date."""
+
+    def __init__(self, current: datetime, requested: datetime):
+        super().__init__(current, requested)
+        self.current = current
+        self.requested = requested
+
+    def __str__(self) -> str:
+        return (
+            f"Cannot advance from {self.current.isoformat()} back to {self.requested.isoformat()}; "
+            "open a new Warp to travel backwards"
+        )
+
+
 class Warp:
     """
     Time Machine context manager for financial projections and analysis.
@@ -150,6 +172,37 @@ class Warp:
 
         return self._warped
 
+    def advance_to(self, target_date: Union[str, date, datetime]) -> Any:
+        """
+        Move the active warp forward to a later date without re-cloning.
+
+        The clone keeps everything it accumulated so far (including any
+        mutations made inside the context); only its time source moves and
+        ``_on_warp`` runs again for the new date.
+
+        Args:
+            target_date: The later date to advance to (same formats as the constructor)
+
+        Returns:
+            The same warped clone returned by ``__enter__``.
+
+        Raises:
+            InactiveWarpError: If called outside an active Warp context
+            BackwardWarpError: If the date is before the current target date
+            InvalidDateError: If the date cannot be parsed
+        """
+        if self._warped is None:
+            raise InactiveWarpError()
+
+        new_date = self._parse_date(target_date)
+        if new_date < self.target_date:
+            raise BackwardWarpError(self.target_date, new_date)
+
+        self.target_date = new_date
+        self._apply_time_warp()
+
+        return self._warped
+
     def _apply_time_warp(self) -> None:
         """Apply time warp to the cloned object.
 
@@ -7,9 +7,13 @@ import pytest
 from money_warp import InterestRate, Loan, Money
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def loan_with_all_installments_paid():
-    """Create a 3-payment loan and pay every scheduled installment exactly."""
+    """Create a 3-payment loan and pay every scheduled installment exactly.
+
+    Built once per module: consumers only inspect it through ``Warp``,
+    which works on a clone and leaves this loan untouched.
+    """
     principal = Money("1000.00")
     rate = InterestRate("5% a")
     due_dates = [
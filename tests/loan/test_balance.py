@@ -1,77 +1,62 @@
 """Tests for Loan balance properties and balance composition."""
 
+import copy
+import dataclasses
 from datetime import date, datetime, timezone
 
+import pytest
+
 from money_warp import InterestRate, Loan, Money, Warp
 
+DISBURSEMENT_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PAYMENT_DATE = datetime(2024, 1, 15, tzinfo=timezone.utc)
 
-def test_loan_initial_current_balance():
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=disbursement_date)
+@pytest.fixture(scope="module")
+def base_loan_template():
+    """Single-installment 10,000.00 loan at 5% a, built once per module."""
+    return Loan(Money("10000.00"), InterestRate("5% a"), [date(2024, 2, 1)], disbursement_date=DISBURSEMENT_DATE)
 
-    # At disbursement time, current balance should equal principal (no accrued interest yet)
-    with Warp(loan, disbursement_date) as warped_loan:
-        assert warped_loan.current_balance == principal
 
+@pytest.fixture
+def fresh_loan(base_loan_template):
+    """Independent copy of the template loan, safe to mutate."""
+    return copy.deepcopy(base_loan_template)
 
-def test_loan_last_payment_date_initial():
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-    loan = Loan(principal, rate, due_dates, disbursement_date)
-    assert loan.last_payment_date == disbursement_date
+def test_loan_initial_current_balance(fresh_loan):
+    # At disbursement time, current balance should equal principal (no accrued interest yet)
+    with Warp(fresh_loan, DISBURSEMENT_DATE) as warped_loan:
+        assert warped_loan.current_balance == Money("10000.00")
 
 
-def test_loan_days_since_last_payment_initial():
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+def test_loan_last_payment_date_initial(fresh_loan):
+    assert fresh_loan.last_payment_date == DISBURSEMENT_DATE
 
-    loan = Loan(principal, rate, due_dates, disbursement_date)
-    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped:
+
+def test_loan_days_since_last_payment_initial(fresh_loan):
+    with Warp(fresh_loan, PAYMENT_DATE) as warped:
         assert warped.days_since_last_payment() == 14
 
 
-def test_loan_days_since_last_payment_defaults_to_now():
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+def test_loan_days_since_last_payment_defaults_to_now(fresh_loan):
     # Should not raise error and return some number
-    days = loan.days_since_last_payment()
+    days = fresh_loan.days_since_last_payment()
     assert isinstance(days, int)
 
 
-def test_loan_principal_balance_initial():
+def test_loan_principal_balance_initial(fresh_loan):
     """Test principal_balance property returns original principal initially."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
-
-    assert loan.principal_balance == principal
+    assert fresh_loan.principal_balance == Money("10000.00")
 
 
-def test_loan_principal_balance_after_payment():
+def test_loan_principal_balance_after_payment(fresh_loan):
     """Test principal_balance decreases after principal payments."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = fresh_loan
     initial_principal = loan.principal_balance
 
     # Make a payment
-    loan.record_payment(Money("1000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan.record_payment(Money("1000.00"), PAYMENT_DATE)
 
     # Principal balance should be reduced
     assert loan.principal_balance < initial_principal
@@ -84,36 +69,25 @@ def test_loan_principal_balance_zero_after_full_payment():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
 
     # Make overpayment to cover all principal
-    loan.record_payment(Money("2000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan.record_payment(Money("2000.00"), PAYMENT_DATE)
 
     assert loan.principal_balance == Money.zero()
 
 
-def test_loan_interest_balance_initial_zero():
+def test_loan_interest_balance_initial_zero(fresh_loan):
     """Test interest_balance is zero at disbursement time."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=disbursement_date)
-
-    with Warp(loan, disbursement_date) as warped_loan:
+    with Warp(fresh_loan, DISBURSEMENT_DATE) as warped_loan:
         assert warped_loan.interest_balance == Money.zero()
 
 
-def test_loan_interest_balance_grows_over_time():
+def test_loan_interest_balance_grows_over_time(fresh_loan):
     """Test interest_balance increases over time."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = fresh_loan
 
-    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped_loan:
+    with Warp(loan, PAYMENT_DATE) as warped_loan:
         interest_after_14_days = warped_loan.interest_balance
 
     with Warp(loan, datetime(2024, 1, 30, tzinfo=timezone.utc)) as warped_loan:
@@ -123,20 +97,16 @@ def test_loan_interest_balance_grows_over_time():
     assert interest_after_29_days > interest_after_14_days
 
 
-def test_loan_interest_balance_resets_after_payment():
+def test_loan_interest_balance_resets_after_payment(fresh_loan):
     """Test interest_balance resets after interest payment."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = fresh_loan
 
-    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped_loan:
+    with Warp(loan, PAYMENT_DATE) as warped_loan:
         interest_before_payment = warped_loan.interest_balance
 
     assert interest_before_payment > Money.zero()
 
-    loan.record_payment(Money("100.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan.record_payment(Money("100.00"), PAYMENT_DATE)
 
     with Warp(loan, datetime(2024, 1, 16, tzinfo=timezone.utc)) as warped_loan:
         interest_after_payment = warped_loan.interest_balance
@@ -144,21 +114,9 @@ def test_loan_interest_balance_resets_after_payment():
     assert interest_after_payment < interest_before_payment
 
 
-def test_loan_current_balance_composition():
+def test_loan_current_balance_composition(fresh_loan):
     """Test current_balance equals sum of four component balances."""
-    principal = Money("10000.00")
-    rate = InterestRate("5% a")
-    due_dates = [date(2024, 2, 1)]
-
-    loan = Loan(
-        principal,
-        rate,
-        due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        fine_rate=InterestRate("2% annual"),
-    )
-
-    with Warp(loan, datetime(2024, 2, 5, tzinfo=timezone.utc)) as warped_loan:
+    with Warp(fresh_loan, datetime(2024, 2, 5, tzinfo=timezone.utc)) as warped_loan:
         warped_loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
 
         principal_bal = warped_loan.principal_balance
@@ -177,9 +135,9 @@ def test_loan_balance_components_with_payments():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1), date(2024, 3, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
 
-    loan.record_payment(Money("500.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan.record_payment(Money("500.00"), PAYMENT_DATE)
 
     with Warp(loan, datetime(2024, 1, 20, tzinfo=timezone.utc)) as warped_loan:
         principal_bal = warped_loan.principal_balance
@@ -203,7 +161,7 @@ def test_loan_balance_components_with_fines_and_payments():
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("3% annual"),
     )
 
@@ -225,3 +183,36 @@ def test_loan_balance_components_with_fines_and_payments():
         assert fines < fines_before_payment
         assert principal_bal < principal
         assert current_bal == principal_bal + interest + mora + fines
+
+
+def test_loan_balance_reads_share_one_forward_pass(fresh_loan):
+    with Warp(fresh_loan, datetime(2024, 2, 10, tzinfo=timezone.utc)) as warped_loan:
+        state = warped_loan._compute_state()
+        assert warped_loan._compute_state() is state
+
+        warped_loan.record_payment(Money("100.00"), datetime(2024, 2, 10, tzinfo=timezone.utc))
+        assert warped_loan._compute_state() is not state
+
+
+def test_loan_balance_sees_sub_cent_payment_update(fresh_loan):
+    reference_loan = copy.deepcopy(fresh_loan)
+    reference_loan.record_payment(Money("100.004"), PAYMENT_DATE)
+    fresh_loan.record_payment(Money("100.001"), PAYMENT_DATE)
+    observed_at = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+    with Warp(fresh_loan, observed_at) as warped_loan:
+        stale = warped_loan.principal_balance
+        payment = next(item for item in warped_loan.cashflow.raw_items() if "payment" in item.tags)
+        payment.update(PAYMENT_DATE, dataclasses.replace(payment.resolve(), amount=Money("100.004")))
+
+        with Warp(reference_loan, observed_at) as warped_reference:
+            expected = warped_reference.principal_balance
+        assert expected.raw_amount != stale.raw_amount
+        assert warped_loan.principal_balance.raw_amount == expected.raw_amount
+
+
+def test_loan_settlements_list_is_a_copy(fresh_loan):
+    fresh_loan.record_payment(Money("100.00"), PAYMENT_DATE)
+    with Warp(fresh_loan, datetime(2024, 1, 20, tzinfo=timezone.utc)) as warped_loan:
+        warped_loan.settlements.clear()
+        assert len(warped_loan.settlements) == 1
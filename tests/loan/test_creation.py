@@ -1,5 +1,6 @@
 """Tests for Loan creation, validation, defaults, and string representation."""
 
+from collections import deque
 from datetime import date, datetime, timezone
 
 import pytest
@@ -79,6 +80,27 @@ def test_loan_creation_sorts_due_dates():
     assert loan.due_dates == expected_sorted
 
 
+def test_loan_creation_copies_already_sorted_due_dates():
+    due_dates = [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+
+    loan = Loan(
+        Money("10000.00"), InterestRate("5% a"), due_dates, disbursement_date=datetime(2023, 12, 1, tzinfo=timezone.utc)
+    )
+    due_dates.append(date(2024, 4, 1))
+
+    assert loan.due_dates == [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+
+
+def test_loan_creation_accepts_non_sliceable_due_dates():
+    due_dates = deque([date(2024, 2, 1), date(2024, 1, 1), date(2024, 3, 1)])
+
+    loan = Loan(
+        Money("10000.00"), InterestRate("5% a"), due_dates, disbursement_date=datetime(2023, 12, 1, tzinfo=timezone.utc)
+    )
+
+    assert loan.due_dates == [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+
+
 def test_loan_creation_empty_due_dates_raises_error():
     principal = Money("10000.00")
     rate = InterestRate("5% a")
@@ -5,19 +5,27 @@ from decimal import Decimal
 
 import pytest
 
-from money_warp import InterestRate, Loan, Money, Warp
+from money_warp import CashFlowItem, EveryDayCalendar, InterestRate, Loan, Money, Warp
+from money_warp.engines import compute_fines_at
+
+RATE_5 = InterestRate("5% a")
+RATE_6 = InterestRate("6% a")
+DISBURSEMENT_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+FINE_OBSERVATION_DATE = datetime(2024, 2, 5, tzinfo=timezone.utc)  # 4 days after the 2024-02-01 due date
+DISBURSEMENT_DATE_2025 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+WARP_DATE_2025 = datetime(2025, 2, 15, tzinfo=timezone.utc)
 
 
 def test_loan_creation_with_fine_parameters():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("3% annual"),
         grace_period_days=5,
     )
@@ -27,17 +35,17 @@ def test_loan_creation_with_fine_parameters():
 
 def test_loan_creation_with_default_fine_parameters():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
     assert loan.fine_rate == InterestRate("2% annual")  # Default 2%
     assert loan.grace_period_days == 0  # Default no grace period
 
 
 def test_loan_creation_negative_fine_rate_raises_error():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     with pytest.raises(ValueError, match="Interest rate cannot be negative"):
@@ -45,14 +53,14 @@ def test_loan_creation_negative_fine_rate_raises_error():
             principal,
             rate,
             due_dates,
-            disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            disbursement_date=DISBURSEMENT_DATE,
             fine_rate=InterestRate("-1% annual"),
         )
 
 
 def test_loan_creation_negative_grace_period_raises_error():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     with pytest.raises(ValueError, match="Grace period days must be non-negative"):
@@ -60,17 +68,17 @@ def test_loan_creation_negative_grace_period_raises_error():
             principal,
             rate,
             due_dates,
-            disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            disbursement_date=DISBURSEMENT_DATE,
             grace_period_days=-1,
         )
 
 
 def test_loan_initial_fine_properties():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
     assert loan.total_fines == Money.zero()
     assert loan.fine_balance == Money.zero()
     assert len(loan.fines_applied) == 0
@@ -78,74 +86,75 @@ def test_loan_initial_fine_properties():
 
 def test_loan_get_expected_payment_amount_valid_date():
     principal = Money("10000.00")
-    rate = InterestRate("6% a")
+    rate = RATE_6
     due_dates = [date(2024, 2, 1), date(2024, 3, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
     expected_payment = loan.get_expected_payment_amount(date(2024, 2, 1))
     assert expected_payment > Money.zero()
 
 
+def test_loan_get_expected_payment_amount_matches_schedule_for_every_due_date():
+    due_dates = [date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1)]
+    loan = Loan(Money("10000.00"), RATE_6, due_dates, disbursement_date=DISBURSEMENT_DATE)
+    for entry in loan.get_original_schedule():
+        assert loan.get_expected_payment_amount(entry.due_date) == entry.payment_amount
+
+
 def test_loan_get_expected_payment_amount_invalid_date_raises_error():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
     with pytest.raises(ValueError, match="Due date .* is not in loan's due dates"):
         loan.get_expected_payment_amount(date(2024, 3, 1))
 
 
 def test_loan_is_payment_late_within_grace_period():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(
-        principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc), grace_period_days=5
-    )
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE, grace_period_days=5)
     check_date = datetime(2024, 2, 3, tzinfo=timezone.utc)  # 2 days after due date, within grace period
     assert not loan.is_payment_late(date(2024, 2, 1), check_date)
 
 
 def test_loan_is_payment_late_after_grace_period():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(
-        principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc), grace_period_days=5
-    )
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE, grace_period_days=5)
     check_date = datetime(2024, 2, 7, tzinfo=timezone.utc)  # 6 days after due date, past grace period
     assert loan.is_payment_late(date(2024, 2, 1), check_date)
 
 
 def test_loan_is_payment_late_no_grace_period():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(
-        principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc), grace_period_days=0
-    )
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE, grace_period_days=0)
     check_date = datetime(2024, 2, 2, tzinfo=timezone.utc)  # 1 day after due date
     assert loan.is_payment_late(date(2024, 2, 1), check_date)
 
 
 def test_loan_calculate_late_fines_applies_fine():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("2% annual"),
         grace_period_days=0,
     )
-    late_date = datetime(2024, 2, 5, tzinfo=timezone.utc)  # 4 days late
+    late_date = FINE_OBSERVATION_DATE  # 4 days late
 
     new_fines = loan.calculate_late_fines(late_date)
     assert new_fines > Money.zero()
@@ -154,54 +163,70 @@ def test_loan_calculate_late_fines_applies_fine():
 
 def test_loan_calculate_late_fines_correct_amount():
     principal = Money("10000.00")
-    rate = InterestRate("6% a")
+    rate = RATE_6
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("5% annual"),
     )  # 5% fine
     expected_payment = loan.get_expected_payment_amount(date(2024, 2, 1))
     expected_fine = Money(expected_payment.raw_amount * Decimal("0.05"))
 
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     assert loan.total_fines == expected_fine
 
 
 def test_loan_calculate_late_fines_only_once_per_due_date():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("2% annual"),
     )
 
     # Apply fines twice for same due date
-    first_fines = loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    first_fines = loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     second_fines = loan.calculate_late_fines(datetime(2024, 2, 10, tzinfo=timezone.utc))
 
     assert first_fines > Money.zero()
     assert second_fines == Money.zero()  # No new fines applied
 
 
+def test_loan_calculate_late_fines_repeated_observation_date_applies_no_new_fines():
+    loan = Loan(
+        Money("10000.00"),
+        RATE_5,
+        [date(2024, 2, 1)],
+        disbursement_date=DISBURSEMENT_DATE,
+    )
+
+    first_fines = loan.calculate_late_fines(FINE_OBSERVATION_DATE)
+    second_fines = loan.calculate_late_fines(FINE_OBSERVATION_DATE)
+
+    assert first_fines > Money.zero()
+    assert second_fines == Money.zero()
+    assert loan.total_fines == first_fines
+
+
 def test_loan_calculate_late_fines_multiple_due_dates():
     principal = Money("10000.00")
-    rate = InterestRate("6% a")
+    rate = RATE_6
     due_dates = [date(2024, 2, 1), date(2024, 3, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("2% annual"),
     )
 
@@ -215,19 +240,19 @@ def test_loan_calculate_late_fines_multiple_due_dates():
 
 def test_loan_record_payment_allocates_to_fines_first():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("2% annual"),
     )
 
     # Apply fines first
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     initial_fines = loan.fine_balance
 
     # Make payment smaller than fines
@@ -248,12 +273,12 @@ def test_loan_record_payment_allocates_fines_then_principal():
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("10% annual"),
     )  # 10% fine
 
     # Apply fines
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     total_fines = loan.fine_balance
 
     # Make payment that covers fines + some principal
@@ -268,19 +293,19 @@ def test_loan_record_payment_allocates_fines_then_principal():
 
 def test_loan_current_balance_includes_fine_balance():
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
+    rate = RATE_5
     due_dates = [date(2024, 2, 1)]
 
     loan = Loan(
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("2% annual"),
     )
     initial_balance = loan.current_balance
 
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     balance_with_fines = loan.current_balance
 
     assert balance_with_fines > initial_balance
@@ -296,7 +321,7 @@ def test_loan_is_paid_off_considers_fines():
         principal,
         rate,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         fine_rate=InterestRate("5% annual"),
     )
 
@@ -305,7 +330,7 @@ def test_loan_is_paid_off_considers_fines():
     assert not loan.is_paid_off  # Should not be paid off yet
 
     # Now apply fines for insufficient payment
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
 
     # Should have fines and still not be paid off
     assert loan.fine_balance > Money.zero()
@@ -322,16 +347,13 @@ def test_loan_is_paid_off_considers_fines():
 )
 def test_loan_fine_calculation_with_different_rates(fine_rate, expected_multiplier):
     principal = Money("10000.00")
-    rate = InterestRate("6% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(
-        principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc), fine_rate=fine_rate
-    )
+    loan = Loan(principal, RATE_6, due_dates, disbursement_date=DISBURSEMENT_DATE, fine_rate=fine_rate)
     expected_payment = loan.get_expected_payment_amount(date(2024, 2, 1))
     expected_fine = Money(expected_payment.raw_amount * expected_multiplier)
 
-    loan.calculate_late_fines(datetime(2024, 2, 5, tzinfo=timezone.utc))
+    loan.calculate_late_fines(FINE_OBSERVATION_DATE)
     assert loan.total_fines == expected_fine
 
 
@@ -347,15 +369,14 @@ def test_loan_fine_calculation_with_different_rates(fine_rate, expected_multipli
 )
 def test_loan_grace_period_scenarios(grace_days, check_day, should_be_late):
     principal = Money("10000.00")
-    rate = InterestRate("5% a")
     due_date = date(2024, 2, 1)
     due_dates = [due_date]
 
     loan = Loan(
         principal,
-        rate,
+        RATE_5,
         due_dates,
-        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE,
         grace_period_days=grace_days,
     )
     check_date = datetime(2024, 2, 1, tzinfo=timezone.utc) + timedelta(days=check_day)
@@ -366,9 +387,9 @@ def test_loan_grace_period_scenarios(grace_days, check_day, should_be_late):
 def test_pay_installment_late_triggers_fines_and_extra_interest():
     """Late payment should apply both fines and charge interest beyond the due date."""
     principal = Money("10000.00")
-    rate = InterestRate("6% a")
+    rate = RATE_6
     due_date = date(2025, 2, 1)
-    disbursement = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    disbursement = DISBURSEMENT_DATE_2025
 
     loan = Loan(
         principal,
@@ -378,7 +399,7 @@ def test_pay_installment_late_triggers_fines_and_extra_interest():
         fine_rate=InterestRate("5% annual"),
     )
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("11000.00"))
         settlement = warped.settlements[-1]
 
@@ -404,20 +425,20 @@ def test_late_overpayment_fine_equals_two_percent_of_scheduled_payment():
     """Fine = 2% of the original Feb 1 scheduled payment amount."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
     scheduled_payment = loan.get_expected_payment_amount(date(2025, 2, 1))
     expected_fine = Money(scheduled_payment.raw_amount * Decimal("0.02"))
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
 
     assert warped.settlements[-1].fine_paid == expected_fine
@@ -427,20 +448,20 @@ def test_late_overpayment_total_interest_for_45_days():
     """Total interest (regular + mora) = 45-day daily-compounded accrual on full $10k principal."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
-    daily_rate = InterestRate("6% a").to_daily().as_decimal()
+    daily_rate = RATE_6.to_daily().as_decimal()
     expected_total = Decimal("10000") * ((1 + daily_rate) ** 45 - 1)
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
         settlement = warped.settlements[-1]
         total_interest = settlement.interest_paid + settlement.mora_paid
@@ -452,23 +473,23 @@ def test_late_overpayment_principal_is_remainder_after_fine_and_interest():
     """Principal paid = $7,000 - fine - interest."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
     scheduled_payment = loan.get_expected_payment_amount(date(2025, 2, 1))
     fine = scheduled_payment.raw_amount * Decimal("0.02")
-    daily_rate = InterestRate("6% a").to_daily().as_decimal()
+    daily_rate = RATE_6.to_daily().as_decimal()
     interest = Decimal("10000") * ((1 + daily_rate) ** 45 - 1)
     expected_principal = Decimal("7000") - fine - interest
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
 
     assert warped.settlements[-1].principal_paid == Money(expected_principal)
@@ -478,24 +499,24 @@ def test_late_overpayment_ending_balance_in_actual_entry():
     """Actual schedule entry: beginning=$10k, ending = $10k - principal paid."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
     scheduled_payment = loan.get_expected_payment_amount(date(2025, 2, 1))
     fine = scheduled_payment.raw_amount * Decimal("0.02")
-    daily_rate = InterestRate("6% a").to_daily().as_decimal()
+    daily_rate = RATE_6.to_daily().as_decimal()
     interest = Decimal("10000") * ((1 + daily_rate) ** 45 - 1)
     principal_paid = Decimal("7000") - fine - interest
     expected_ending = Decimal("10000") - principal_paid
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
 
     assert warped.settlements[-1].remaining_balance == Money(expected_ending)
@@ -505,17 +526,17 @@ def test_late_overpayment_covers_two_installments():
     """The large principal reduction covers installments 1 and 2; only Apr 1 remains."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
         next_unpaid = warped._next_unpaid_due_date()
 
@@ -526,19 +547,48 @@ def test_late_overpayment_projected_entry_closes_loan():
     """Projected Apr 1 entry should pay off the remaining balance to zero."""
     loan = Loan(
         Money("10000.00"),
-        InterestRate("6% a"),
+        RATE_6,
         [
             date(2025, 2, 1),
             date(2025, 3, 1),
             date(2025, 4, 1),
         ],
-        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        disbursement_date=DISBURSEMENT_DATE_2025,
         fine_rate=InterestRate("2% annual"),
     )
 
-    with Warp(loan, datetime(2025, 2, 15, tzinfo=timezone.utc)) as warped:
+    with Warp(loan, WARP_DATE_2025) as warped:
         warped.pay_installment(Money("7000.00"))
         schedule = warped.get_amortization_schedule()
         projected = schedule[-1]
 
     assert projected.ending_balance == Money.zero()
+
+
+def test_compute_fines_at_accepts_unsorted_payment_entries():
+    due_dates = [date(2024, 2, 1), date(2024, 3, 1)]
+    loan = Loan(Money("10000.00"), RATE_5, due_dates, disbursement_date=DISBURSEMENT_DATE)
+    schedule = loan.get_original_schedule()
+    # Both payments land inside their due date's proximity window, not on it.
+    first = CashFlowItem(
+        schedule[0].payment_amount, datetime(2024, 1, 30, tzinfo=timezone.utc), category="payment"
+    ).resolve()
+    second = CashFlowItem(
+        schedule[1].payment_amount, datetime(2024, 2, 28, tzinfo=timezone.utc), category="payment"
+    ).resolve()
+
+    def fines_for(entries):
+        return compute_fines_at(
+            datetime(2024, 3, 5, tzinfo=timezone.utc),
+            due_dates,
+            schedule,
+            loan.fine_rate,
+            0,
+            {},
+            entries,
+            timezone.utc,
+            EveryDayCalendar(),
+        )
+
+    assert fines_for([first, second]) == {}
+    assert fines_for([second, first]) == {}
@@ -10,7 +10,7 @@ from datetime import date, datetime, timezone
 
 import pytest
 
-from money_warp import InterestRate, Loan, Money, Warp
+from money_warp import InterestRate, Loan, Money, PaymentSchedule, PriceScheduler, Warp
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -291,3 +291,30 @@ def test_zero_tolerance_never_adds_adjustment():
 
     cf_items = [e for e in loan.cashflow.items() if "Tolerance adjustment" in (e.description or "")]
     assert len(cf_items) == 0
+
+
+def test_original_schedule_entry_matches_due_date(three_installment_loan):
+    for due_date in three_installment_loan.due_dates:
+        assert three_installment_loan._original_schedule_entry(due_date).due_date == due_date
+    assert three_installment_loan._original_schedule_entry(date(2025, 2, 2)) is None
+
+
+def test_original_schedule_entry_with_reordered_custom_schedule():
+    class ReversedScheduler(PriceScheduler):
+        @classmethod
+        def generate_schedule(cls, *args, **kwargs):
+            schedule = super().generate_schedule(*args, **kwargs)
+            return PaymentSchedule(entries=schedule.entries[::-1])
+
+    loan = Loan(
+        Money("10000"),
+        InterestRate("6% a"),
+        [date(2025, 2, 1), date(2025, 3, 1), date(2025, 4, 1)],
+        disbursement_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        scheduler=ReversedScheduler,
+    )
+
+    entry = loan._original_schedule_entry(date(2025, 2, 1))
+
+    assert entry.due_date == date(2025, 2, 1)
+    assert entry.payment_number == 1
@@ -6,14 +6,17 @@ import pytest
 
 from money_warp import InterestRate, Loan, Money, Warp
 
+DISBURSEMENT_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PAYMENT_DATE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
 
 def test_loan_record_payment_updates_balance():
     principal = Money("10000.00")
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
-    loan.record_payment(Money("5000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
+    loan.record_payment(Money("5000.00"), PAYMENT_DATE)
 
     # Balance should be reduced by principal portion
     assert loan.current_balance < principal
@@ -23,10 +26,10 @@ def test_loan_record_payment_creates_interest_and_principal_items():
     principal = Money("10000.00")
     rate = InterestRate("6% a")
     due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    disbursement_date = DISBURSEMENT_DATE
 
     loan = Loan(principal, rate, due_dates, disbursement_date)
-    loan.record_payment(Money("5000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan.record_payment(Money("5000.00"), PAYMENT_DATE)
 
     settlement = loan.settlements[-1]
     assert settlement.interest_paid.is_positive()
@@ -39,10 +42,10 @@ def test_loan_record_payment_updates_last_payment_date():
     principal = Money("10000.00")
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
-    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    disbursement_date = DISBURSEMENT_DATE
 
     loan = Loan(principal, rate, due_dates, disbursement_date)
-    payment_date = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    payment_date = PAYMENT_DATE
 
     assert loan.last_payment_date == disbursement_date
 
@@ -55,8 +58,8 @@ def test_loan_record_payment_multiple_payments():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
-    loan.record_payment(Money("3000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
+    loan.record_payment(Money("3000.00"), PAYMENT_DATE)
     loan.record_payment(Money("2000.00"), datetime(2024, 1, 20, tzinfo=timezone.utc))
 
     assert loan.current_balance < principal
@@ -67,8 +70,8 @@ def test_loan_record_payment_overpayment_zeros_balance():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
-    loan.record_payment(Money("15000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
+    loan.record_payment(Money("15000.00"), PAYMENT_DATE)
 
     assert loan.current_balance == Money.zero()
     assert loan.is_paid_off
@@ -79,10 +82,10 @@ def test_loan_record_payment_negative_amount_raises_error():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
 
     with pytest.raises(ValueError, match="Payment amount must be positive"):
-        loan.record_payment(Money("-1000.00"), datetime(2024, 1, 15, tzinfo=timezone.utc))
+        loan.record_payment(Money("-1000.00"), PAYMENT_DATE)
 
 
 def test_loan_record_payment_zero_amount_raises_error():
@@ -90,10 +93,10 @@ def test_loan_record_payment_zero_amount_raises_error():
     rate = InterestRate("5% a")
     due_dates = [date(2024, 2, 1)]
 
-    loan = Loan(principal, rate, due_dates, disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    loan = Loan(principal, rate, due_dates, disbursement_date=DISBURSEMENT_DATE)
 
     with pytest.raises(ValueError, match="Payment amount must be positive"):
-        loan.record_payment(Money.zero(), datetime(2024, 1, 15, tzinfo=timezone.utc))
+        loan.record_payment(Money.zero(), PAYMENT_DATE)
 
 
 def test_loan_current_balance_zero_after_all_installments_paid(loan_with_all_installments_paid):
@@ -1,8 +1,11 @@
 """Tests for Loan amortization schedule generation and edge cases."""
 
+import dataclasses
 from datetime import date, datetime, timedelta, timezone
 
-from money_warp import InterestRate, Loan, Money
+import pytest
+
+from money_warp import InterestRate, Loan, Money, Warp
 
 
 def test_loan_get_amortization_schedule_structure():
@@ -91,3 +94,104 @@ def test_loan_many_payments():
     principal_items = cash_flow.query.filter_by(category="principal").all()
     assert len(interest_items) == 24
     assert len(principal_items) == 24
+
+
+def test_loan_original_schedule_is_cached():
+    loan = Loan(
+        Money("10000.00"),
+        InterestRate("6% a"),
+        [date(2024, 2, 1), date(2024, 3, 1)],
+        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert loan._original_schedule() is loan._original_schedule()
+
+
+def test_loan_original_schedule_returns_independent_copy():
+    loan = Loan(
+        Money("10000.00"),
+        InterestRate("6% a"),
+        [date(2024, 2, 1), date(2024, 3, 1)],
+        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    schedule = loan.get_original_schedule()
+    schedule.entries[0].payment_amount = Money("1.00")
+    schedule.entries.clear()
+
+    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped:
+        warped_schedule = warped.get_original_schedule()
+        warped_schedule.entries.clear()
+        assert len(warped.get_original_schedule()) == 2
+
+    fresh = loan.get_original_schedule()
+    assert len(fresh) == 2
+    assert fresh[0].payment_amount == loan.get_expected_payment_amount(date(2024, 2, 1))
+    assert fresh[0].payment_amount != Money("1.00")
+
+
+def test_loan_amortization_schedule_is_cached_until_a_payment():
+    loan = Loan(
+        Money("10000.00"),
+        InterestRate("6% a"),
+        [date(2024, 2, 1), date(2024, 3, 1)],
+        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped:
+        warped.record_payment(Money("3000.00"), datetime(2024, 1, 10, tzinfo=timezone.utc))
+        before = warped.get_amortization_schedule()
+        cached = warped._amortization_cache[1]
+        assert warped.get_amortization_schedule() == before
+        assert warped._amortization_cache[1] is cached
+
+        warped.record_payment(Money("1000.00"), datetime(2024, 1, 12, tzinfo=timezone.utc))
+        after = warped.get_amortization_schedule()
+        assert warped._amortization_cache[1] is not cached
+
+    assert len(after) == len(before) + 1
+
+
+@pytest.mark.parametrize("payment", [None, Money("3000.00")])
+def test_loan_amortization_schedule_returns_independent_copy(payment):
+    loan = Loan(
+        Money("10000.00"),
+        InterestRate("6% a"),
+        [date(2024, 2, 1), date(2024, 3, 1)],
+        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    with Warp(loan, datetime(2024, 1, 15, tzinfo=timezone.utc)) as warped:
+        if payment is not None:
+            warped.record_payment(payment, datetime(2024, 1, 10, tzinfo=timezone.utc))
+        expected = len(warped.get_amortization_schedule())
+        schedule = warped.get_amortization_schedule()
+        schedule.entries[0].payment_amount = Money("1.00")
+        schedule.entries.clear()
+
+        fresh = warped.get_amortization_schedule()
+        assert len(fresh) == expected
+        assert fresh[0].payment_amount != Money("1.00")
+        assert len(warped.get_original_schedule()) == 2
+
+
+def test_loan_amortization_schedule_sees_sub_cent_payment_update():
+    def make_loan():
+        return Loan(
+            Money("10000.00"),
+            InterestRate("6% a"),
+            [date(2024, 2, 1), date(2024, 3, 1)],
+            disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    payment_date = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    observed_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    with Warp(make_loan(), observed_at) as reference:
+        reference.record_payment(Money("3000.004"), payment_date)
+        expected = reference.get_amortization_schedule()[0].principal_payment.raw_amount
+
+    with Warp(make_loan(), observed_at) as warped:
+        warped.record_payment(Money("3000.001"), payment_date)
+        before = warped.get_amortization_schedule()
+        payment = next(item for item in warped.cashflow.raw_items() if "payment" in item.tags)
+        payment.update(payment_date, dataclasses.replace(payment.resolve(), amount=Money("3000.004")))
+        after = warped.get_amortization_schedule()
+
+    assert before[0].principal_payment.raw_amount != expected
+    assert after[0].principal_payment.raw_amount == expected
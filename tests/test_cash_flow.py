@@ -274,6 +274,53 @@ def test_cash_flow_filter_by_category_no_matches():
     assert principal_cf.is_empty()
 
 
+def test_cash_flow_entries_by_category_sees_items_added_after_first_lookup():
+    cf = CashFlow(
+        [
+            CashFlowItem(Money("100.00"), datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc), category="interest"),
+        ]
+    )
+    cf.entries_by_category("interest")
+    cf.add(Money("25.00"), datetime(2024, 3, 15, 10, 0, tzinfo=timezone.utc), category="interest")
+
+    assert len(cf.entries_by_category("interest")) == 2
+
+
+def test_cash_flow_entries_by_category_sees_tags_added_by_update():
+    item = CashFlowItem(Money("100.00"), datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc), category="interest")
+    cf = CashFlow([item])
+    cf.entries_by_category("fee")
+    item.update(
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        HappenedCashFlowEntry(
+            amount=Money("100.00"),
+            datetime=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+            category=frozenset({"interest", "fee"}),
+        ),
+    )
+
+    assert len(cf.entries_by_category("fee")) == 1
+
+
+def test_cash_flow_category_index_survives_tags_added_in_another_flow():
+    cf = CashFlow([CashFlowItem(Money("50.00"), datetime(2024, 1, 10, tzinfo=timezone.utc), category="interest")])
+    cf.entries_by_category("interest")
+    index = cf._category_index
+    item = CashFlowItem(Money("100.00"), datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc), category="interest")
+    CashFlow([item])
+    item.update(
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        HappenedCashFlowEntry(
+            amount=Money("100.00"),
+            datetime=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+            category=frozenset({"interest", "fee"}),
+        ),
+    )
+
+    assert len(cf.entries_by_category("interest")) == 1
+    assert cf._category_index is index
+
+
 def test_cash_flow_filter_by_datetime_range():
     cf = CashFlow(
         [
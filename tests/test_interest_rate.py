@@ -1,5 +1,6 @@
 """Tests for InterestRate class - following project patterns."""
 
+import copy
 from decimal import Decimal
 
 import pytest
@@ -150,6 +151,22 @@ def test_interest_rate_to_daily_returns_daily_frequency():
     assert daily_rate.period == CompoundingFrequency.DAILY
 
 
+def test_interest_rate_to_daily_is_cached():
+    annual_rate = InterestRate("5% a")
+    assert annual_rate.to_daily() is annual_rate.to_daily()
+
+
+def test_interest_rate_to_monthly_is_cached():
+    annual_rate = InterestRate("5% a")
+    assert annual_rate.to_monthly() is annual_rate.to_monthly()
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_interest_rate_copy_returns_same_instance(copier):
+    rate = InterestRate("5% a")
+    assert copier(rate) is rate
+
+
 def test_interest_rate_to_annual_from_monthly():
     monthly_rate = InterestRate("0.5% m")
     annual_rate = monthly_rate.to_annual()
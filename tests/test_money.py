@@ -1,5 +1,7 @@
 """Tests for Money class - following project patterns."""
 
+import copy
+import operator
 from decimal import Decimal
 
 import pytest
@@ -22,6 +24,11 @@ def test_money_creation_from_various_types(amount, expected):
     assert money.real_amount == expected
 
 
+def test_money_creation_from_decimal_keeps_the_same_decimal():
+    amount = Decimal("100.123456")
+    assert Money(amount).raw_amount is amount
+
+
 def test_money_creation_zero_class_method():
     money = Money.zero()
     assert money.real_amount == Decimal("0.00")
@@ -32,6 +39,16 @@ def test_money_creation_zero_is_zero():
     assert money.is_zero()
 
 
+def test_money_creation_zero_is_shared_instance():
+    assert Money.zero() is Money.zero()
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_money_copy_returns_same_instance(copier):
+    money = Money("100.50")
+    assert copier(money) is money
+
+
 def test_money_creation_from_cents():
     money = Money.from_cents(12345)
     assert money.real_amount == Decimal("123.45")
@@ -74,36 +91,20 @@ def test_money_debug_precision_shows_real_amount():
 
 
 # Arithmetic tests
-def test_money_addition_basic_amounts():
-    money1 = Money("100.50")
-    money2 = Money("50.25")
-    result = money1 + money2
-    assert result.real_amount == Decimal("150.75")
-
-
-def test_money_subtraction_basic_amounts():
-    money1 = Money("100.50")
-    money2 = Money("50.25")
-    result = money1 - money2
-    assert result.real_amount == Decimal("50.25")
-
-
-def test_money_multiplication_by_integer():
-    money = Money("100.00")
-    result = money * 2
-    assert result.real_amount == Decimal("200.00")
-
-
-def test_money_multiplication_by_decimal():
-    money = Money("100.00")
-    result = money * Decimal("1.5")
-    assert result.real_amount == Decimal("150.00")
-
-
-def test_money_division_by_integer():
-    money = Money("100.00")
-    result = money / 2
-    assert result.real_amount == Decimal("50.00")
+@pytest.mark.parametrize(
+    "op,left,right,expected",
+    [
+        (operator.add, "100.50", Money("50.25"), Decimal("150.75")),
+        (operator.sub, "100.50", Money("50.25"), Decimal("50.25")),
+        (operator.mul, "100.00", 2, Decimal("200.00")),
+        (operator.mul, "100.00", Decimal("1.5"), Decimal("150.00")),
+        (operator.truediv, "100.00", 2, Decimal("50.00")),
+    ],
+    ids=["add", "sub", "mul_int", "mul_decimal", "div_int"],
+)
+def test_money_basic_arithmetic(op, left, right, expected):
+    result = op(Money(left), right)
+    assert result.real_amount == expected
 
 
 def test_money_division_maintains_high_precision():
@@ -396,3 +397,14 @@ def test_money_approx_outside_tolerance():
 
 def test_money_approx_default_tolerance():
     assert Money("200.00") == pytest.approx(Money("200"))
+
+
+def test_money_adding_zero_returns_the_other_operand():
+    money = Money("100.123456")
+    assert money + Money.zero() is money
+    assert Money.zero() + money is money
+
+
+def test_money_equality_against_zero():
+    assert Money("0.004") == Money.zero()
+    assert Money("0.005") != Money.zero()
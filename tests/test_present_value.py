@@ -16,6 +16,10 @@ from money_warp import (
     present_value_of_perpetuity,
 )
 
+RATE_0 = InterestRate("0% annual")
+RATE_5 = InterestRate("5% annual")
+RATE_10 = InterestRate("10% annual")
+
 
 @pytest.fixture
 def simple_cash_flow():
@@ -31,7 +35,7 @@ def simple_cash_flow():
 # Basic present value tests
 def test_present_value_empty_cash_flow():
     empty_cf = CashFlow.empty()
-    pv = present_value(empty_cf, InterestRate("5% annual"))
+    pv = present_value(empty_cf, RATE_5)
     assert pv.is_zero()
 
 
@@ -40,7 +44,7 @@ def test_present_value_single_cash_flow():
     cf = CashFlow(items)
 
     # PV of $1000 in 1 year at 10% should be about $909.09
-    pv = present_value(cf, InterestRate("10% annual"), datetime(2024, 1, 1, tzinfo=timezone.utc))
+    pv = present_value(cf, RATE_10, datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     # Allow for small rounding differences due to daily compounding
     expected = Money("909.09")
@@ -49,22 +53,21 @@ def test_present_value_single_cash_flow():
 
 def test_present_value_with_default_valuation_date(simple_cash_flow):
     # Should use earliest cash flow date (2024-01-01) as valuation date
-    pv = present_value(simple_cash_flow, InterestRate("5% annual"))
+    pv = present_value(simple_cash_flow, RATE_5)
 
     # Should be positive since we have net positive cash flows
     assert pv.is_positive()
 
 
 def test_present_value_zero_interest_rate(simple_cash_flow):
-    pv = present_value(simple_cash_flow, InterestRate("0% annual"))
+    pv = present_value(simple_cash_flow, RATE_0)
 
     # With zero discount rate, PV equals sum of all cash flows
-    total_cash_flow = sum((item.amount for item in simple_cash_flow), Money.zero())
-    assert pv == total_cash_flow
+    assert pv == simple_cash_flow.net_present_value()
 
 
 def test_present_value_high_discount_rate(simple_cash_flow):
-    low_rate_pv = present_value(simple_cash_flow, InterestRate("5% annual"))
+    low_rate_pv = present_value(simple_cash_flow, RATE_5)
     high_rate_pv = present_value(simple_cash_flow, InterestRate("20% annual"))
 
     # Higher discount rate should result in lower present value
@@ -74,7 +77,7 @@ def test_present_value_high_discount_rate(simple_cash_flow):
 # Present Value of Annuity tests
 def test_present_value_of_annuity_ordinary():
     # PV of $1000 monthly for 12 months at 5% annual (converted to monthly)
-    monthly_rate = InterestRate("5% annual").to_monthly()
+    monthly_rate = RATE_5.to_monthly()
     pv = present_value_of_annuity(Money("1000"), monthly_rate, 12)
 
     # Should be less than $12,000 due to time value of money
@@ -83,7 +86,7 @@ def test_present_value_of_annuity_ordinary():
 
 
 def test_present_value_of_annuity_due():
-    monthly_rate = InterestRate("5% annual").to_monthly()
+    monthly_rate = RATE_5.to_monthly()
 
     ordinary_pv = present_value_of_annuity(Money("1000"), monthly_rate, 12, "end")
     due_pv = present_value_of_annuity(Money("1000"), monthly_rate, 12, "begin")
@@ -93,43 +96,50 @@ def test_present_value_of_annuity_due():
 
 
 def test_present_value_of_annuity_zero_periods():
-    pv = present_value_of_annuity(Money("1000"), InterestRate("5% annual"), 0)
+    pv = present_value_of_annuity(Money("1000"), RATE_5, 0)
     assert pv.is_zero()
 
 
 def test_present_value_of_annuity_zero_payment():
-    pv = present_value_of_annuity(Money.zero(), InterestRate("5% annual"), 12)
+    pv = present_value_of_annuity(Money.zero(), RATE_5, 12)
     assert pv.is_zero()
 
 
 def test_present_value_of_annuity_zero_interest():
     # With zero interest, PV should equal total payments
-    pv = present_value_of_annuity(Money("1000"), InterestRate("0% annual"), 12)
+    pv = present_value_of_annuity(Money("1000"), RATE_0, 12)
     assert pv == Money("12000")
 
 
 @pytest.mark.parametrize("payment_timing", ["end", "begin", "beginning", "due"])
 def test_present_value_of_annuity_payment_timing_variations(payment_timing):
     # Should accept various strings for payment timing
-    pv = present_value_of_annuity(Money("100"), InterestRate("5% annual"), 10, payment_timing)
+    pv = present_value_of_annuity(Money("100"), RATE_5, 10, payment_timing)
     assert pv.is_positive()
 
 
+@pytest.mark.parametrize("periods", [12.0, Decimal("12")])
+def test_present_value_of_annuity_non_int_periods(periods):
+    monthly_rate = RATE_5.to_monthly()
+    expected = present_value_of_annuity(Money("1000"), monthly_rate, 12)
+    assert present_value_of_annuity(Money("1000"), monthly_rate, periods) == expected
+
+
 # Present Value of Perpetuity tests
 def test_present_value_of_perpetuity_basic():
     # PV of $100 annual payments forever at 5% should be $2000
-    pv = present_value_of_perpetuity(Money("100"), InterestRate("5% annual"))
+    pv = present_value_of_perpetuity(Money("100"), RATE_5)
     assert pv == Money("2000")
 
 
 def test_present_value_of_perpetuity_zero_payment():
-    pv = present_value_of_perpetuity(Money.zero(), InterestRate("5% annual"))
+    pv = present_value_of_perpetuity(Money.zero(), RATE_5)
     assert pv.is_zero()
 
 
 def test_present_value_of_perpetuity_zero_interest_raises_error():
     with pytest.raises(ValueError, match="Interest rate must be positive"):
-        present_value_of_perpetuity(Money("100"), InterestRate("0% annual"))
+        present_value_of_perpetuity(Money("100"), RATE_0)
 
 
 def test_present_value_of_perpetuity_negative_interest_raises_error():
@@ -144,7 +154,7 @@ def test_present_value_of_perpetuity_negative_interest_raises_error():
 
 
 def test_present_value_of_perpetuity_high_vs_low_rates():
-    high_rate_pv = present_value_of_perpetuity(Money("100"), InterestRate("10% annual"))
+    high_rate_pv = present_value_of_perpetuity(Money("100"), RATE_10)
     low_rate_pv = present_value_of_perpetuity(Money("100"), InterestRate("2% annual"))
 
     # Lower interest rate should result in higher present value
@@ -153,20 +163,20 @@ def test_present_value_of_perpetuity_high_vs_low_rates():
 
 # Discount Factor tests
 def test_discount_factor_zero_periods():
-    df = discount_factor(InterestRate("5% annual"), 0)
+    df = discount_factor(RATE_5, 0)
     assert df == Decimal("1")
 
 
 def test_discount_factor_one_period():
     # DF = 1 / (1 + 0.05)^1 = 1/1.05 ≈ 0.9524
-    df = discount_factor(InterestRate("5% annual"), 1)
+    df = discount_factor(RATE_5, 1)
     expected = Decimal("1") / Decimal("1.05")
     assert abs(df - expected) < Decimal("0.0001")
 
 
 def test_discount_factor_multiple_periods():
     # DF = 1 / (1 + 0.10)^2 = 1/1.21 ≈ 0.8264
-    df = discount_factor(InterestRate("10% annual"), 2)
+    df = discount_factor(RATE_10, 2)
     expected = Decimal("1") / (Decimal("1.10") ** 2)
     assert abs(df - expected) < Decimal("0.0001")
 
@@ -215,7 +225,7 @@ def test_present_value_past_cash_flows():
     cf = CashFlow(items)
 
     # Valuation date after first cash flow
-    pv = present_value(cf, InterestRate("5% annual"), datetime(2024, 1, 1, tzinfo=timezone.utc))
+    pv = present_value(cf, RATE_5, datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     # Past cash flows should not be discounted (treated as period 0)
     # Future cash flows should be discounted
@@ -232,7 +242,7 @@ def test_present_value_with_time_machine_philosophy():
     # Create a loan and its expected cash flows
     loan = Loan(
         Money("10000"),
-        InterestRate("5% annual"),
+        RATE_5,
         [
             date(2024, 1, 15),
             date(2024, 2, 15),
@@ -258,7 +268,7 @@ def test_present_value_with_time_machine_philosophy():
 # Edge cases and error conditions
 def test_present_value_very_high_discount_rate(simple_cash_flow):
     # Very high discount rate should make future cash flows nearly worthless
-    pv_low_rate = present_value(simple_cash_flow, InterestRate("5% annual"))
+    pv_low_rate = present_value(simple_cash_flow, RATE_5)
     pv_high_rate = present_value(simple_cash_flow, InterestRate("100% annual"))
 
     # Higher discount rate should result in lower (more negative or less positive) PV
@@ -271,13 +281,30 @@ def test_present_value_precision_with_daily_compounding():
     cf = CashFlow(items)
 
     # 180 days at 5% annual
-    pv = present_value(cf, InterestRate("5% annual"), datetime(2024, 1, 4, tzinfo=timezone.utc))
+    pv = present_value(cf, RATE_5, datetime(2024, 1, 4, tzinfo=timezone.utc))
 
     # Should be discounted but not too much for half a year
     assert pv < Money("1000")
     assert pv > Money("950")
 
 
+def test_present_value_same_date_items_match_combined_item():
+    due = datetime(2024, 7, 2, tzinfo=timezone.utc)
+    split_cf = CashFlow(
+        [
+            CashFlowItem(Money("400"), due, "Interest", "interest"),
+            CashFlowItem(Money("600"), due, "Principal", "principal"),
+        ]
+    )
+    combined_cf = CashFlow([CashFlowItem(Money("1000"), due, "Installment", "payment")])
+    valuation_date = datetime(2024, 1, 4, tzinfo=timezone.utc)
+
+    split_pv = present_value(split_cf, RATE_5, valuation_date)
+    combined_pv = present_value(combined_cf, RATE_5, valuation_date)
+
+    assert split_pv.real_amount == combined_pv.real_amount
+
+
 # String representation and debugging
 def test_present_value_functions_with_string_representations():
     """Test that all functions work with Money objects that have proper string representations."""
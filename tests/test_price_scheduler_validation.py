@@ -5,7 +5,7 @@ from decimal import Decimal
 
 import pytest
 
-from money_warp import InterestRate, Money, PriceScheduler
+from money_warp import InterestRate, Money, PaymentSchedule, PriceScheduler
 
 
 def test_price_scheduler_reference_values():
@@ -92,6 +92,36 @@ def test_price_scheduler_zero_interest_validation():
     assert schedule.total_principal == principal
 
 
+def test_price_scheduler_zero_interest_ignores_period_lengths():
+    """Test zero-interest PMT is principal / N however irregular the periods are."""
+    principal = Money("900.00")
+    rate = InterestRate("0% a")
+    due_dates = [date(2024, 1, 5), date(2024, 3, 20), date(2024, 4, 1)]
+
+    schedule = PriceScheduler.generate_schedule(
+        principal, rate, due_dates, datetime(2024, 1, 1, tzinfo=timezone.utc), timezone.utc
+    )
+
+    assert [entry.days_in_period for entry in schedule] == [4, 75, 12]
+    assert [entry.payment_amount for entry in schedule] == [Money("300.00")] * 3
+    assert schedule.total_interest == Money.zero()
+
+
+def test_price_scheduler_zero_interest_uneven_split_closes_on_last_payment():
+    """Test zero-interest PMT rounding is absorbed by the last payment."""
+    principal = Money("1000.00")
+    rate = InterestRate("0% a")
+    due_dates = [date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1)]
+
+    schedule = PriceScheduler.generate_schedule(
+        principal, rate, due_dates, datetime(2024, 1, 1, tzinfo=timezone.utc), timezone.utc
+    )
+
+    assert [entry.payment_amount for entry in schedule] == [Money("333.33"), Money("333.33"), Money("333.34")]
+    assert schedule.total_interest == Money.zero()
+    assert schedule[-1].ending_balance == Money.zero()
+
+
 def test_price_scheduler_single_payment_validation():
     """Test PriceScheduler with a single payment (bullet loan)."""
     principal = Money("50000.00")  # $50,000 loan
@@ -185,6 +215,21 @@ def test_price_scheduler_irregular_schedule_validation():
     assert abs(schedule[-1].ending_balance.real_amount) < Decimal("0.01")
 
 
+def test_price_scheduler_pmt_matches_reference_formula_for_irregular_periods():
+    """Test the schedule PMT equals the reference return-days formula."""
+    principal = Money("10000.00")
+    rate = InterestRate("8% a")
+    disbursement_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    due_dates = [date(2024, 2, 15), date(2024, 4, 1), date(2024, 6, 1), date(2024, 8, 15)]
+
+    schedule = PriceScheduler.generate_schedule(principal, rate, due_dates, disbursement_date, timezone.utc)
+
+    return_days = [(due_date - disbursement_date.date()).days for due_date in due_dates]
+    reference = PriceScheduler(principal.raw_amount, rate.to_daily().as_decimal(), return_days)
+    expected_pmt = Money(reference.calculate_constant_return_pmt())
+    assert all(entry.payment_amount == expected_pmt for entry in schedule.entries[:-1])
+
+
 def test_price_scheduler_high_precision_validation():
     """Test PriceScheduler maintains precision in calculations."""
     principal = Money("123456.78")  # Odd amount
@@ -248,3 +293,35 @@ def test_price_scheduler_parametrized_validation(principal_amount, annual_rate,
     # Total payments should equal principal plus interest
     expected_total = schedule.total_principal + schedule.total_interest
     assert abs(schedule.total_payments.raw_amount - expected_total.raw_amount) < Decimal("0.01")
+
+
+def test_price_scheduler_totals_match_entry_sums():
+    """Test the totals accumulated during generation equal the summed entry columns."""
+    principal = Money("7345.67")
+    rate = InterestRate("23.5% a")
+    due_dates = [date(2024, 2, 3), date(2024, 3, 1), date(2024, 4, 17), date(2024, 5, 2), date(2024, 7, 30)]
+
+    schedule = PriceScheduler.generate_schedule(
+        principal, rate, due_dates, datetime(2024, 1, 10, tzinfo=timezone.utc), timezone.utc
+    )
+
+    assert schedule.total_payments == Money(sum(entry.payment_amount.raw_amount for entry in schedule))
+    assert schedule.total_interest == Money(sum(entry.interest_payment.raw_amount for entry in schedule))
+    assert schedule.total_principal == Money(sum(entry.principal_payment.raw_amount for entry in schedule))
+
+
+def test_payment_schedule_uses_given_totals():
+    """Test precomputed totals passed to PaymentSchedule replace the column sums."""
+    schedule = PriceScheduler.generate_schedule(
+        Money("1000.00"),
+        InterestRate("12% a"),
+        [date(2024, 2, 1)],
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        timezone.utc,
+    )
+    totals = (Money("3.00"), Money("2.00"), Money("1.00"))
+
+    rebuilt = PaymentSchedule(entries=schedule.entries, totals=totals)
+
+    assert (rebuilt.total_payments, rebuilt.total_interest, rebuilt.total_principal) == totals
+    assert PaymentSchedule(entries=schedule.entries).total_payments == schedule.total_payments
@@ -138,6 +138,29 @@ def test_time_context_shared_in_deepcopy():
     assert cloned_a._time_ctx is not ctx
 
 
+def test_cashflow_entry_shared_in_deepcopy():
+    entry = HappenedCashFlowEntry(
+        amount=Money("100.00"),
+        datetime=datetime(2024, 1, 15, tzinfo=timezone.utc),
+    )
+    item = CashFlowItem(entry=entry, time_context=TimeContext())
+
+    cloned = copy.deepcopy(item)
+
+    assert cloned.resolve() is entry
+    assert cloned._time_ctx is not item._time_ctx
+
+
+def test_cashflow_item_deepcopy_has_independent_timeline():
+    item = CashFlowItem(Money("100.00"), datetime(2024, 1, 15, tzinfo=timezone.utc), time_context=TimeContext())
+
+    cloned = copy.deepcopy(item)
+    cloned.delete(datetime(2024, 1, 20, tzinfo=timezone.utc))
+
+    assert len(cloned._timeline) == 2
+    assert len(item._timeline) == 1
+
+
 # -- Warp overrides TimeContext ---------------------------------------------
 
 
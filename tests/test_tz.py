@@ -6,7 +6,7 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
-from money_warp.tz import _DefaultTimeSource, ensure_aware, get_tz, now, set_tz, to_date, tz_aware
+from money_warp.tz import _DefaultTimeSource, ensure_aware, ensure_aware_many, get_tz, now, set_tz, to_date, tz_aware
 
 # --- get_tz / set_tz ---
 
@@ -108,6 +108,27 @@ def test_ensure_aware_keeps_datetime_values_unchanged():
     assert result.second == 45
 
 
+def test_ensure_aware_returns_utc_datetime_unchanged():
+    original = get_tz()
+    try:
+        set_tz("America/Sao_Paulo")
+        utc_dt = datetime(2024, 6, 15, 14, 30, tzinfo=timezone.utc)
+        assert ensure_aware(utc_dt) is utc_dt
+    finally:
+        set_tz(original)
+
+
+def test_ensure_aware_many_matches_ensure_aware_per_element():
+    original = get_tz()
+    try:
+        set_tz("America/Sao_Paulo")
+        dates = [datetime(2024, 6, 15, 22), datetime(2024, 6, 16, tzinfo=ZoneInfo("Asia/Tokyo"))]
+        assert ensure_aware_many(dates) == [ensure_aware(d) for d in dates]
+        assert all(d.tzinfo == timezone.utc for d in ensure_aware_many(dates))
+    finally:
+        set_tz(original)
+
+
 # --- _DefaultTimeSource ---
 
 
@@ -196,6 +217,27 @@ def test_tz_aware_leaves_non_datetime_args_untouched():
     assert func("hello", 42) == "hello-42"
 
 
+def test_tz_aware_coerces_naive_keyword_only_arg():
+    @tz_aware
+    def func(*, dt: datetime) -> datetime:
+        return dt
+
+    result = func(dt=datetime(2024, 1, 1))
+    assert result.tzinfo == timezone.utc
+
+
+def test_tz_aware_leaves_var_args_untouched():
+    @tz_aware
+    def func(dt: datetime, *rest, **extra):
+        return dt, rest, extra
+
+    naive = datetime(2024, 1, 1)
+    result, rest, extra = func(naive, naive, other=naive)
+    assert result.tzinfo == timezone.utc
+    assert rest == (naive,)
+    assert extra == {"other": naive}
+
+
 def test_tz_aware_works_on_method_with_self():
     class Dummy:
         @tz_aware
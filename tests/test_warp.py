@@ -1,10 +1,22 @@
 """Tests for Warp time machine context manager."""
 
 from datetime import date, datetime, timezone
+from decimal import Decimal
 
 import pytest
 
-from money_warp import InterestRate, InvalidDateError, Loan, Money, NestedWarpError, Warp
+from money_warp import (
+    IOF,
+    BackwardWarpError,
+    InactiveWarpError,
+    InterestRate,
+    InvalidDateError,
+    Loan,
+    Money,
+    NestedWarpError,
+    Warp,
+    WarpError,
+)
 
 
 @pytest.fixture
@@ -67,6 +79,34 @@ def test_warp_context_manager_clones_loan(sample_loan):
     assert sample_loan.current_balance == original_balance
 
 
+def test_warp_clone_shares_original_schedule(sample_loan):
+    with Warp(sample_loan, "2030-01-15") as warped_loan:
+        assert warped_loan._original_schedule() is sample_loan._original_schedule()
+        assert warped_loan.cashflow is not sample_loan.cashflow
+
+
+def test_warp_clone_does_not_share_tax_results():
+    loan = Loan(
+        Money("10000.00"),
+        InterestRate("5% annual"),
+        [date(2024, 2, 1), date(2024, 3, 1)],
+        disbursement_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        taxes=[IOF(daily_rate=Decimal("0.000082"), additional_rate=Decimal("0.0038"))],
+    )
+    total_tax = loan.total_tax
+    with Warp(loan, "2030-01-15") as warped_loan:
+        warped_loan.tax_amounts.clear()
+    assert "IOF" in loan.tax_amounts
+    assert loan.total_tax == total_tax
+
+
+def test_warp_clone_shares_interest_rates(sample_loan):
+    with Warp(sample_loan, "2030-01-15") as warped_loan:
+        assert warped_loan.interest_rate is sample_loan.interest_rate
+        assert warped_loan.mora_interest_rate is sample_loan.mora_interest_rate
+        assert warped_loan._time_ctx is not sample_loan._time_ctx
+
+
 # Nested warp detection
 def test_warp_nested_contexts_raise_error(sample_loan):
     with Warp(sample_loan, "2030-01-15"), pytest.raises(NestedWarpError):
@@ -105,6 +145,38 @@ def test_warp_sequential_contexts_work(sample_loan):
     assert isinstance(balance2, Money)
 
 
+def test_warp_advance_to_matches_a_fresh_warp(sample_loan):
+    sample_loan.record_payment(Money("500"), datetime(2024, 1, 10, tzinfo=timezone.utc))
+    later = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+    warp = Warp(sample_loan, datetime(2024, 1, 20, tzinfo=timezone.utc))
+    with warp as warped_loan:
+        early_balance = warped_loan.current_balance
+        advanced = warp.advance_to(later)
+        advanced_balance = advanced.current_balance
+        advanced_fines = advanced.fine_balance
+
+    with Warp(sample_loan, later) as fresh_loan:
+        assert advanced is warped_loan
+        assert advanced_balance != early_balance
+        assert advanced_balance == fresh_loan.current_balance
+        assert advanced_fines == fresh_loan.fine_balance
+
+
+def test_warp_advance_to_earlier_date_raises_error(sample_loan):
+    warp = Warp(sample_loan, "2024-02-01")
+    with warp, pytest.raises(InvalidDateError, match="open a new Warp") as excinfo:
+        warp.advance_to("2024-01-20")
+    assert isinstance(excinfo.value, BackwardWarpError)
+    assert excinfo.value.requested < excinfo.value.current
+
+
+def test_warp_advance_to_outside_context_raises_error(sample_loan):
+    with pytest.raises(WarpError, match="requires an active Warp context") as excinfo:
+        Warp(sample_loan, "2024-02-01").advance_to("2024-03-01")
+    assert isinstance(excinfo.value, InactiveWarpError)
+
+
 # Time-aware functionality tests
 def test_warp_overrides_current_datetime(sample_loan):
     target_date = datetime(2030, 6, 15, 14, 30, 0, tzinfo=timezone.utc)